@@ -1,5 +1,6 @@
 import asyncio
 import os
+import re
 from typing import Union
 
 from discord import (
@@ -15,6 +16,11 @@ from discord import (
 from discord.errors import Forbidden, HTTPException, NotFound
 from discord.ext import commands
 
+from .indexes import get_emoji_index
+
+CUSTOM_EMOJI_REGEX = re.compile(r"<a?:(?P<name>[a-zA-Z0-9_]{1,32}):(?P<id>[0-9]{15,20})>$|(?P<bare_id>[0-9]{15,20})$")
+EMOJI_NAME_REGEX = re.compile(r":?([a-zA-Z0-9_]{2,32}):?$")
+
 
 class Context(commands.Context):
     def __init__(self, **kwargs):
@@ -35,15 +41,11 @@ class Context(commands.Context):
         del_em : Union[:class:`bool`, :class:`int`, :class:`str`, :class:`Emoji`, None]
             The emoji to use for the delete reaction.
         """
-        if str(del_em).lower() in ("true", "t", "1", "enabled", "on", "yes", "y"):  #
-            del_em = "🗑️"  # If it's only a bool, then default to trash can unicode
+        del_em = await make_emoji(
+            self.bot, del_em
+        )  # Custom emojis by ID, name or `<a?:name:ID>`, otherwise unicode or trash
         if not del_em:  # It wasn't enabled
             return
-        if not isinstance(del_em, Emoji):
-            try:
-                del_em = await self.bot.fetch_emoji(int(del_em))  # Get a custom emoji by ID if possible
-            except (NotFound, HTTPException):
-                del_em = str(del_em)  # It's either unicode, full custom format `<a?:name:ID>`, or trash
         try:
             await msg.add_reaction(del_em)  # Attempt to add the reaction
         except HTTPException:
@@ -51,7 +53,7 @@ class Context(commands.Context):
         try:
             await self.bot.wait_for(
                 "reaction_add",
-                check=lambda r, u: str(r.emoji) == del_em
+                check=lambda r, u: str(r.emoji) == str(del_em)
                 and not u.bot
                 and (u.id == self.author.id or r.message.channel.permissions_for(u).manage_messages)
                 and r.message.id == msg.id,
@@ -328,19 +330,37 @@ class ContextEditor:
         Union[:class:`Emoji`, :class:`PartialEmoji`, :class:`str`, :class:`int`]
             The emoji object if possible, otherwise the original input.
         """
-        if str(emoji).lower() in ("true", "t", "1", "enabled", "on", "yes", "y"):
-            emoji = "🗑️"  # If it's only a bool, then default to trash can unicode
-        if not emoji:  # It wasn't enabled
-            return None
-        if isinstance(emoji, Emoji):
-            return emoji
-        if emoji.isdigit():
-            emoji = bot.get_emoji(int(emoji))  # Get a custom emoji by ID if possible
-            if emoji is None:
-                emoji = (int if allow_partial else str)(emoji)
-        else:
-            emoji = str(emoji)
+        return await make_emoji(bot, emoji, allow_partial=allow_partial)
+
+
+async def make_emoji(
+    bot: commands.Bot,
+    emoji: Union[Emoji, PartialEmoji, int, str],
+    *,
+    allow_partial: bool = False,
+):
+    """
+    The implementation of :meth:`ContextEditor.make_emoji`.
+    Custom emojis are looked up by ID, ``<:name:ID>`` or ``:name:`` in the bot's emoji index.
+    """
+    if str(emoji).lower() in ("true", "t", "1", "enabled", "on", "yes", "y"):
+        emoji = "🗑️"  # If it's only a bool, then default to trash can unicode
+    if not emoji:  # It wasn't enabled
+        return None
+    if isinstance(emoji, (Emoji, PartialEmoji)):
+        return emoji
+    emoji = str(emoji)
+    index = get_emoji_index(bot)
+    if match := CUSTOM_EMOJI_REGEX.match(emoji):
+        found = index.get(int(match.group("id") or match.group("bare_id")))  # Get a custom emoji by ID if possible
+        if found is not None:
+            return found
+        if allow_partial:
+            return PartialEmoji.from_str(emoji) if match.group("name") else int(emoji)
         return emoji
+    if match := EMOJI_NAME_REGEX.match(emoji):
+        return index.first(match.group(1)) or emoji
+    return emoji
 
 
 async def setup(bot: commands.Bot):
@@ -1,9 +1,18 @@
+from .cache import (
+    ArchivedThreadCache,
+    ResolutionCache,
+    SingleFlight,
+    disable_resolution_cache,
+    enable_resolution_cache,
+)
 from .checks import check_hierarchy, is_guild_owner
+from .colors import NAMED_COLORS, parse_color, parse_colors
 from .ContextEditor2 import Context, ContextEditor, DeleteButton
 from .converters import (
     AnyChannel,
     BotMember,
     BotUser,
+    BulkConversion,
     CategoryChannel,
     Color,
     Emoji,
@@ -14,10 +23,13 @@ from .converters import (
     HumanUser,
     IgnoreCaseLiteral,
     IntList,
+    IntSequence,
     InvalidPermission,
     KillCommand,
     Member,
+    MemberList,
     Message,
+    MessageList,
     NewsChannel,
     NonCategoryChannel,
     Permissions,
@@ -26,13 +38,22 @@ from .converters import (
     TextChannel,
     Thread,
     User,
+    UserList,
     UserNotType,
     VoiceChannel,
+    fetch_messages,
+    parse_overwrites,
+    parse_permission_bits,
+    parse_permissions,
 )
 from .duration import Duration, InvalidTimeFormat, ParsedDuration
 from .duration import parse as parse_duration
-from .duration import strfdur
+from .duration import parse_many as parse_durations
+from .duration import strfdur, strfdur_many
 from .flags import Flag, FlagConverter, FlagIsSwitch, flag, get_flag_signature
 from .HelpCommand import EmbedHelpCommand
+from .metrics import CallbackSink, ConversionEvent, LoggingSink, MemorySink, add_sink, remove_sink
+from .transformers import ChannelTransformer, IndexTransformer, MemberTransformer, RoleTransformer
+from .usercache import UserCache, disable_user_cache, enable_user_cache
 from .utils import _and, an, load_extensions, s, trim, try_dm, yn
 from .views import Confirmation
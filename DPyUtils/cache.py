@@ -0,0 +1,407 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Set, Tuple, TypeVar
+
+import discord
+from discord.ext.commands import Bot
+
+T = TypeVar("T")
+
+
+class ResolutionCache:
+    """
+    An LRU cache of converter results with a TTL, keyed by ``(converter, guild_id, argument)``.
+
+    Entries are invalidated as soon as a member, user, role, channel, thread or emoji update/delete
+    event touches the object they resolved to. Ambiguous results that needed the user to pick
+    one are never cached.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum amount of entries to keep
+    ttl : float
+        How many seconds an entry stays valid
+
+    Attributes
+    ----------
+    hits : int
+        The amount of lookups answered from the cache
+    misses : int
+        The amount of lookups that weren't cached or had expired
+    """
+
+    events = (
+        "on_member_update",
+        "on_raw_member_remove",
+        "on_user_update",
+        "on_guild_role_update",
+        "on_guild_role_delete",
+        "on_guild_channel_update",
+        "on_guild_channel_delete",
+        "on_thread_update",
+        "on_raw_thread_delete",
+        "on_guild_emojis_update",
+    )
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._by_id: Dict[int, Set[Hashable]] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def install(self, bot: Bot):
+        for event in self.events:
+            bot.add_listener(getattr(self, event), event)
+
+    def uninstall(self, bot: Bot):
+        for event in self.events:
+            bot.remove_listener(getattr(self, event), event)
+
+    def get(self, key: Hashable):
+        """
+        Returns the cached result for a key, or None if it isn't cached or has expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                self._drop(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, result: Any):
+        """
+        Caches a result, evicting the least recently used entries if the cache is full.
+        """
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (time.monotonic() + self.ttl, result)
+        self._by_id.setdefault(result.id, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: Hashable):
+        _, result = self._entries.pop(key)
+        keys = self._by_id.get(result.id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_id[result.id]
+
+    def invalidate(self, obj_id: int):
+        """
+        Drops every entry that resolved to the object with the given ID.
+        """
+        for key in self._by_id.pop(obj_id, ()):
+            self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+        self._by_id.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        self.invalidate(after.id)
+
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        self.invalidate(payload.user.id)
+
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        self.invalidate(after.id)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self.invalidate(after.id)
+
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.invalidate(role.id)
+
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        self.invalidate(after.id)
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.invalidate(channel.id)
+
+    async def on_thread_update(self, before: discord.Thread, after: discord.Thread):
+        self.invalidate(after.id)
+
+    async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent):
+        self.invalidate(payload.thread_id)
+
+    async def on_guild_emojis_update(self, guild: discord.Guild, before, after):
+        current = {emoji.id: emoji.name for emoji in after}
+        for emoji in before:
+            if current.get(emoji.id) != emoji.name:
+                self.invalidate(emoji.id)
+
+
+def enable_resolution_cache(bot: Bot, *, maxsize: int = 1024, ttl: float = 300.0) -> ResolutionCache:
+    """
+    Turns on converter result caching for a bot. The cache is available afterwards as ``bot.converters_resolution_cache``.
+
+    Parameters
+    ----------
+    bot : Bot
+        Your bot instance
+    maxsize : int
+        The maximum amount of entries to keep
+    ttl : float
+        How many seconds an entry stays valid
+
+    Examples
+    --------
+    .. code-block:: python3
+
+        cache = enable_resolution_cache(bot, maxsize=4096, ttl=60)
+        ...
+        print(cache.stats())  # {'size': 812, 'hits': 10349, 'misses': 2210, 'hit_rate': 0.82}
+    """
+    disable_resolution_cache(bot)
+    cache = bot.converters_resolution_cache = ResolutionCache(maxsize, ttl)
+    cache.install(bot)
+    return cache
+
+
+def disable_resolution_cache(bot: Bot):
+    """
+    Turns converter result caching back off.
+    """
+    cache = getattr(bot, "converters_resolution_cache", None)
+    if cache is not None:
+        cache.uninstall(bot)
+        del bot.converters_resolution_cache
+
+
+class _ArchivePages:
+    __slots__ = ("expires", "pages", "exhausted", "lock")
+
+    def __init__(self, ttl: float):
+        self.expires = time.monotonic() + ttl
+        self.pages: List[List[discord.Thread]] = []
+        self.exhausted = False
+        self.lock = asyncio.Lock()
+
+
+class ArchivedThreadCache:
+    """
+    Caches the pages of public archived threads fetched per parent channel, for a TTL.
+
+    Pages are only fetched when a lookup gets past the ones already cached, and a parent's pages are
+    dropped when one of its threads is archived, unarchived, joined or deleted, or the parent itself is deleted.
+    Updates are followed through the raw event, since archived threads are rarely in the cache.
+
+    Parameters
+    ----------
+    ttl : float
+        How many seconds a parent's pages stay valid
+    page_size : int
+        How many threads to request per page (at most 100)
+    """
+
+    events = ("on_raw_thread_update", "on_thread_join", "on_raw_thread_delete", "on_guild_channel_delete")
+
+    def __init__(self, ttl: float = 300.0, page_size: int = 100):
+        self.ttl = ttl
+        self.page_size = page_size
+        self._parents: Dict[int, _ArchivePages] = {}
+
+    def install(self, bot: Bot):
+        for event in self.events:
+            bot.add_listener(getattr(self, event), event)
+
+    async def pages(
+        self, parent: discord.TextChannel | discord.ForumChannel
+    ) -> AsyncIterator[Tuple[List[discord.Thread], bool]]:
+        """
+        Yields a parent's archived threads page by page, most recently archived first, along with
+        whether the page had to be fetched. Cached pages come first, the rest are fetched as the caller asks for them.
+        """
+        entry = self._parents.get(parent.id)
+        if entry is None or entry.expires < time.monotonic():
+            entry = self._parents[parent.id] = _ArchivePages(self.ttl)
+        i = 0
+        while True:
+            if i < len(entry.pages):
+                yield entry.pages[i], False
+                i += 1
+                continue
+            if entry.exhausted:
+                return
+            async with entry.lock:
+                if i < len(entry.pages) or entry.exhausted:
+                    # Someone else fetched it while we waited
+                    continue
+                before = entry.pages[-1][-1].archive_timestamp if entry.pages else None
+                page = [thread async for thread in parent.archived_threads(limit=self.page_size, before=before)]
+                entry.exhausted = len(page) < self.page_size
+                if page:
+                    entry.pages.append(page)
+            if page:
+                yield page, True
+                i += 1
+
+    def invalidate(self, parent_id: int | None):
+        self._parents.pop(parent_id, None)
+
+    def clear(self):
+        self._parents.clear()
+
+    async def on_raw_thread_update(self, payload: discord.RawThreadUpdateEvent):
+        # payload.thread is the cached thread as it was before the update, if it was cached at all
+        before = payload.thread
+        if before is None or before.archived or payload.data.get("thread_metadata", {}).get("archived"):
+            self.invalidate(payload.parent_id)
+
+    async def on_thread_join(self, thread: discord.Thread):
+        self.invalidate(thread.parent_id)
+
+    async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent):
+        self.invalidate(payload.parent_id)
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.invalidate(channel.id)
+
+
+def get_archived_thread_cache(bot: Bot) -> ArchivedThreadCache:
+    """
+    Returns the bot's :class:`ArchivedThreadCache`, creating it and registering its listeners on first use.
+    """
+    cache = getattr(bot, "converters_archived_threads", None)
+    if cache is None:
+        cache = bot.converters_archived_threads = ArchivedThreadCache()
+        cache.install(bot)
+    return cache
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent lookups: callers asking for a key that is already being looked up wait
+    for that request instead of sending their own. Keys that turned out not to exist are remembered
+    for ``negative_ttl`` seconds, so repeated lookups of a missing ID don't reach the API at all.
+
+    Parameters
+    ----------
+    negative_ttl : float
+        How many seconds a missing key is remembered
+    maxsize : int
+        The maximum amount of missing keys to remember
+
+    Attributes
+    ----------
+    calls : int
+        The amount of lookups requested
+    shared : int
+        The amount of lookups that joined one already in flight
+    negative_hits : int
+        The amount of lookups answered from the negative cache
+    """
+
+    events = ("on_member_join",)
+
+    def __init__(self, negative_ttl: float = 30.0, maxsize: int = 4096):
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
+        self.calls = 0
+        self.shared = 0
+        self.negative_hits = 0
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._missing: "OrderedDict[Hashable, float]" = OrderedDict()
+
+    def install(self, bot: Bot):
+        for event in self.events:
+            bot.add_listener(getattr(self, event), event)
+
+    def is_missing(self, key: Hashable) -> bool:
+        expires = self._missing.get(key)
+        if expires is None:
+            return False
+        if expires < time.monotonic():
+            del self._missing[key]
+            return False
+        return True
+
+    def forget(self, key: Hashable):
+        """
+        Drops a key from the negative cache, e.g. because the object has appeared since.
+        """
+        self._missing.pop(key, None)
+
+    def _mark_missing(self, key: Hashable):
+        self._missing[key] = time.monotonic() + self.negative_ttl
+        self._missing.move_to_end(key)
+        while len(self._missing) > self.maxsize:
+            self._missing.popitem(last=False)
+
+    async def _lookup(self, key: Hashable, factory: Callable[[], Awaitable[T]], missing: Tuple[type, ...]):
+        try:
+            result = await factory()
+        except missing:
+            result = None
+        finally:
+            del self._inflight[key]
+        if result is None:
+            self._mark_missing(key)
+        return result
+
+    async def run(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[T]],
+        missing: Tuple[type, ...] = (discord.NotFound,),
+    ) -> T | None:
+        """
+        Returns the result of ``factory()``, sharing it with every concurrent call for the same key.
+
+        Returns None without calling ``factory`` if the key is in the negative cache. A result of None,
+        or one of the ``missing`` exceptions, puts the key in the negative cache; other exceptions are
+        raised to every caller and not remembered. A caller being cancelled doesn't cancel the shared lookup.
+        """
+        self.calls += 1
+        if self.is_missing(key):
+            self.negative_hits += 1
+            return None
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(self._lookup(key, factory, missing))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._inflight),
+            "missing": len(self._missing),
+            "calls": self.calls,
+            "shared": self.shared,
+            "negative_hits": self.negative_hits,
+        }
+
+    async def on_member_join(self, member: discord.Member):
+        self.forget(("member", member.guild.id, member.id))
+
+
+def get_single_flight(bot: Bot) -> SingleFlight:
+    """
+    Returns the bot's :class:`SingleFlight` for converter fallbacks, creating it and registering its listeners on first use.
+    """
+    flight = getattr(bot, "converters_single_flight", None)
+    if flight is None:
+        flight = bot.converters_single_flight = SingleFlight()
+        flight.install(bot)
+    return flight
@@ -1,6 +1,17 @@
 import asyncio
+import functools
+import heapq
 import inspect
 import re
+import time
+import traceback
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from contextvars import ContextVar
+from itertools import accumulate, chain, compress, count, repeat
+from logging import getLogger
+from operator import eq
 from typing import Iterable, List, Literal, Tuple, Type, TypeVar
 
 import discord
@@ -19,6 +30,7 @@ from discord.ext.commands.converter import (
     IDConverter,
     MemberConverter,
     MessageConverter,
+    PartialMessageConverter,
     RoleConverter,
     StageChannelConverter,
     TextChannelConverter,
@@ -31,14 +43,37 @@ from discord.ext.commands.converter import (
 from discord.ext.commands.errors import (
     ArgumentParsingError,
     BadArgument,
-    BadColorArgument,
     ChannelNotFound,
+    ChannelNotReadable,
+    EmojiNotFound,
     MemberNotFound,
+    MessageNotFound,
     NoPrivateMessage,
     RoleNotFound,
     ThreadNotFound,
     UserNotFound,
 )
+from discord.flags import flag_value
+
+from . import metrics
+from .cache import ResolutionCache, get_archived_thread_cache, get_single_flight
+from .colors import parse_color
+from .indexes import (
+    IndexUnion,
+    NameIndex,
+    PrefixTrie,
+    closest,
+    get_channel_directory,
+    get_emoji_index,
+    get_member_index,
+    get_user_index,
+)
+from .metrics import TIERS, ConversionEvent, Timings, note, note_fallback
+from .usercache import fetch_user
+from .utils import trim
+from .views import Disambiguation
+
+log = getLogger(__name__)
 
 # TODO:: Update GuildChannel converters to reflect new d.py 2.0 streamlined state
 
@@ -67,6 +102,37 @@ class InvalidPermission(BadArgument):
         super().__init__(f"{argument} is not a valid permission!")
 
 
+class FuzzyMatches(list):
+    """
+    The close-but-not-matching results of a search with a fuzzy tier.
+    :func:`result_handler` always asks the user to confirm these, even when there's only one.
+    """
+
+
+class FuzzyConverter:
+    """
+    A mixin for the search-based converters that adds an optional "did you mean" tier.
+
+    Set ``fuzzy_limit`` on a subclass to offer up to that many close matches when nothing matches the argument,
+    and ``fuzzy_cutoff`` to the minimum similarity (from 0 to 1) a name needs to be offered.
+
+    Examples
+    --------
+    .. code-block:: python3
+
+        class FuzzyRole(Role):
+            fuzzy_limit = 5
+            fuzzy_cutoff = 0.7
+    """
+
+    fuzzy_limit: int = 0
+    fuzzy_cutoff: float = 0.6
+
+    @classmethod
+    def fuzzy_kwargs(cls) -> dict:
+        return {"fuzzy_limit": cls.fuzzy_limit, "fuzzy_cutoff": cls.fuzzy_cutoff}
+
+
 def _m_or_u(iterable):
     if isinstance(iterable[0], discord.Member):
         return "Member"
@@ -88,6 +154,55 @@ SearchObjT = TypeVar(
 )
 
 
+def _member_filter(discrim: str | None, mem_type: Literal["EITHER", "BOT", "HUMAN"]):
+    """
+    Builds the discriminator and member type predicate used when searching members or users, or None if there's nothing to filter.
+    """
+    if mem_type not in ["BOT", "HUMAN", "EITHER"]:
+        raise ArgumentParsingError(
+            "Oh no! Something's gone wrong with the converter! Please DM clari7744 (642416218967375882) with the context of what caused this to break."
+        )
+    if not discrim and mem_type == "EITHER":
+        return None
+    bot = None if mem_type == "EITHER" else mem_type == "BOT"
+    return lambda x: (not discrim or x.discriminator == discrim) and (bot is None or x.bot == bot)
+
+
+def _narrow(tiers: Iterable[list], keep=None) -> Tuple[int | None, list]:
+    """
+    Returns the first tier of results that is non-empty after filtering, and its position.
+    """
+    for tier, result in enumerate(tiers):
+        if result and keep is not None:
+            result = [x for x in result if keep(x)]
+        if result:
+            return tier, result
+    return None, []
+
+
+def _search_result(
+    argument: str,
+    result: list,
+    kind: Literal["Member", "User"] | None = None,
+    mem_type: Literal["EITHER", "BOT", "HUMAN"] = "EITHER",
+):
+    """
+    Shapes a list of matches the way :func:`search` returns them: None, a single object, or a list.
+    """
+    if isinstance(result, FuzzyMatches):
+        return result
+    if kind is not None and not result:
+        if mem_type == "BOT":
+            raise UserNotType(argument, "bot", kind)
+        elif mem_type == "HUMAN":
+            raise UserNotType(argument, "human", kind)
+    if len(result) < 1:
+        return None
+    if len(result) == 1:
+        return result[0]
+    return result
+
+
 def search(
     argument: str,
     iterable: list[SearchObjT],
@@ -108,49 +223,185 @@ def search(
         The attributes to check on each object
     mem_type : str
         The type of member to search for
+    discrim : str
+        The discriminator the member or user must have, if any
+    extra_checks : list
+        Extra predicates to try, in order, if none of the name tiers match
+    fuzzy_limit : int
+        If set, return up to this many similar names as :class:`FuzzyMatches` when nothing else matches
+    fuzzy_cutoff : float
+        The minimum similarity (from 0 to 1) for the fuzzy tier
+
+    The iterable may also be a :class:`indexes.NameIndex` (or :class:`indexes.IndexUnion`), in which case ``attrs`` are ignored
+    and the index's precomputed (casefolded) names are used instead of scanning.
     """
     discrim = kwargs.pop("discriminator", kwargs.pop("discrim", None))
     extra_checks = kwargs.pop("extra_checks", [])
-    iterable = tuple(iterable)
+    fuzzy_limit = kwargs.pop("fuzzy_limit", 0)
+    fuzzy_cutoff = kwargs.pop("fuzzy_cutoff", 0.6)
+    if not isinstance(iterable, (NameIndex, IndexUnion)):
+        iterable = tuple(iterable)
     if len(iterable) < 1:
         raise Exception("Iterable is empty.")
-    result = None
-    checks = [
-        lambda x: any([getattr(x, attr, None) == argument for attr in attrs]),
-        lambda x: any([getattr(x, attr, None).startswith(argument) for attr in attrs]),
-        lambda x: any([getattr(x, attr, None).lower().startswith(argument.lower()) for attr in attrs]),
-        lambda x: any([argument in getattr(x, attr, None) for attr in attrs]),
-        lambda x: any([argument.lower() in getattr(x, attr, None).lower() for attr in attrs]),
-    ]
-    checks.extend(extra_checks)
-    for check in checks:
-        if result:
-            break
-        result = [x for x in iterable if check(x)]
-        if isinstance(iterable[0], (discord.Member, discord.User, discord.ClientUser)) and result:
-            if discrim:
-                result = [x for x in result if x.discriminator == discrim]
-            if mem_type in ["BOT", "HUMAN", "EITHER"]:
-                if mem_type == "BOT":
-                    result = [x for x in result if x.bot]
-                elif mem_type == "HUMAN":
-                    result = [x for x in result if not x.bot]
-            else:
-                raise ArgumentParsingError(
-                    "Oh no! Something's gone wrong with the converter! Please DM clari7744 (642416218967375882) with the context of what caused this to break."
-                )
-
-    if isinstance(iterable[0], (discord.Member, discord.User, discord.ClientUser)):
-        if not result:
-            if mem_type == "BOT":
-                raise UserNotType(argument, "bot", _m_or_u(iterable))
-            elif mem_type == "HUMAN":
-                raise UserNotType(argument, "human", _m_or_u(iterable))
-    if len(result) < 1:
+    first = next(iter(iterable))
+    is_user = isinstance(first, (discord.Member, discord.User, discord.ClientUser))
+    keep = _member_filter(discrim, mem_type) if is_user else None
+    if isinstance(iterable, (NameIndex, IndexUnion)):
+        tier, result = _narrow(iterable.tiers(argument), keep)
+    else:
+        tier, result = _score(argument, iterable, attrs, keep)
+    tier = TIERS[tier] if result else "none"
+    if not result and extra_checks:
+        _, result = _narrow(([x for x in iterable if check(x)] for check in extra_checks), keep)
+        tier = "extra" if result else tier
+    if not result and fuzzy_limit > 0:
+        if isinstance(iterable, (NameIndex, IndexUnion)):
+            result = iterable.closest(argument, fuzzy_limit, fuzzy_cutoff, keep)
+        else:
+            keyed = (
+                (value.casefold(), (obj,))
+                for obj in iterable
+                for value in {getattr(obj, attr, None) for attr in attrs} - {None}
+            )
+            result = closest(argument, keyed, fuzzy_limit, fuzzy_cutoff, keep)
+        result = FuzzyMatches(result) if result else []
+        tier = "fuzzy" if result else tier
+    note(tier=tier, searched=len(iterable), candidates=len(result))
+    return _search_result(argument, result, _m_or_u((first,)) if is_user else None, mem_type)
+
+
+def _matching(iterable: Tuple[SearchObjT, ...], attrs: Tuple[str, ...], values, test, operand) -> List[SearchObjT]:
+    """
+    Returns the objects for which ``test(values(attr), operand)`` is true for any attribute, in their original order.
+
+    The attribute reads and tests all run inside C-level ``map``s, so non-matching objects never reach Python code.
+    """
+    found = set()
+    for attr in attrs:
+        found.update(
+            compress(count(), map(test, values(map(getattr, iterable, repeat(attr), repeat(None))), repeat(operand)))
+        )
+    return [iterable[i] for i in sorted(found)]
+
+
+def _folded(values):
+    return map(str.casefold, map(str, values))
+
+
+def _score(
+    argument: str, iterable: Tuple[SearchObjT, ...], attrs: Tuple[str, ...], keep=None
+) -> Tuple[int, List[SearchObjT]]:
+    """
+    Returns the best search tier any object reaches and the objects in it.
+
+    Tiers are, best first: exact, prefix, case-insensitive prefix, substring, case-insensitive substring.
+    The lookup takes up to three passes: an equality pass over every attribute of every object, which
+    answers exact matches on its own; a case-insensitive substring pass, which drops every object that
+    can't reach any tier; and a Python pass that places the remaining objects in their tier, skipping
+    the checks for tiers worse than the best one found so far.
+    """
+    exact = _matching(iterable, attrs, iter, eq, argument)
+    if keep is not None:
+        exact = [x for x in exact if keep(x)]
+    if exact:
+        return 0, exact
+    folded = argument.casefold()
+    best = 5
+    matches = []
+    # everything in a tier also contains the casefolded argument, so only those objects need scoring
+    for obj in _matching(iterable, attrs, _folded, str.__contains__, folded):
+        if keep is not None and not keep(obj):
+            continue
+        tier = 5
+        for attr in attrs:
+            value = getattr(obj, attr, None)
+            if value is None:
+                continue
+            if value == argument:
+                tier = 0
+                break
+            bound = min(tier - 1, best)
+            if bound < 1:
+                continue
+            if value.startswith(argument):
+                tier = 1
+                continue
+            if bound < 2:
+                continue
+            folded_value = value.casefold()
+            if folded_value.startswith(folded):
+                tier = 2
+            elif bound >= 3 and argument in value:
+                tier = 3
+            elif bound >= 4 and folded in folded_value:
+                tier = 4
+        if tier < best:
+            best = tier
+            matches = [obj]
+        elif tier == best and tier < 5:
+            matches.append(obj)
+    return best, matches
+
+
+def search_members(
+    guild: discord.Guild,
+    argument: str,
+    *,
+    discrim: str | None = None,
+    mem_type: Literal["EITHER", "BOT", "HUMAN"] = "EITHER",
+    **kwargs,
+) -> discord.Member | List[discord.Member] | None:
+    """
+    Equivalent to ``search(argument, guild.members, "name", "display_name")``, but answered from the guild's member name index.
+
+    Parameters
+    ----------
+    guild : discord.Guild
+        The guild to search the members of
+    argument : str
+        The search term
+    discrim : str
+        The discriminator the member must have, if any
+    mem_type : str
+        The type of member to search for
+    kwargs
+        Passed on to :func:`search`
+    """
+    index = get_member_index(guild._state._get_client()).get(guild)
+    if len(index) < 1:
         return None
-    if len(result) == 1:
-        return result[0]
-    return result
+    return search(argument, index, discrim=discrim, mem_type=mem_type, **kwargs)
+
+
+def search_users(
+    bot: Bot,
+    argument: str,
+    *,
+    discrim: str | None = None,
+    mem_type: Literal["EITHER", "BOT", "HUMAN"] = "EITHER",
+    **kwargs,
+) -> discord.User | List[discord.User] | None:
+    """
+    Equivalent to ``search(argument, bot.users, "name")``, but answered from the bot's user name index
+    without copying the user cache. Bot and human users are indexed separately, so ``mem_type`` picks a partition.
+
+    Parameters
+    ----------
+    bot : Bot
+        The bot whose users to search
+    argument : str
+        The search term
+    discrim : str
+        The discriminator the user must have, if any
+    mem_type : str
+        The type of user to search for
+    kwargs
+        Passed on to :func:`search`
+    """
+    index = get_user_index(bot).get(mem_type)
+    if len(index) < 1:
+        return _search_result(argument, [], "User", mem_type)
+    return search(argument, index, discrim=discrim, mem_type=mem_type, **kwargs)
 
 
 async def on_command_error(ctx: Context, error):
@@ -160,65 +411,114 @@ async def on_command_error(ctx: Context, error):
         await ctx.bot.converters_original_on_command_error(ctx, error)
 
 
+MAX_PROMPT_RESULTS = 100
+_prompted: ContextVar[bool] = ContextVar("_prompted", default=False)
+
+
+async def _instrumented(resolve, converter, ctx: Context, argument: str, *args, **kwargs):
+    """
+    Runs a conversion with a :class:`metrics.ConversionEvent` in context for the hooks to fill in, then emits it.
+    A conversion that never searched by name resolved an ID or mention.
+    """
+    event = ConversionEvent((converter if isinstance(converter, type) else type(converter)).__name__)
+    token = metrics.current_event.set(event)
+    start = time.perf_counter()
+    try:
+        return await resolve(converter, ctx, argument, *args, **kwargs)
+    except Exception as e:
+        event.error = type(e).__name__
+        raise
+    finally:
+        event.elapsed = time.perf_counter() - start
+        metrics.current_event.reset(token)
+        if event.path is None:
+            event.path = "id" if event.tier is None else "name"
+        metrics.emit(event)
+
+
+def instrumented(func):
+    """
+    Decorates a converter's ``convert`` so its calls are reported to the :mod:`metrics` sinks, if any were added
+    with :func:`metrics.add_sink`. Converters using :func:`cached_resolution` are already instrumented.
+    """
+
+    @functools.wraps(func)
+    async def convert(self, ctx: Context, argument: str, *args, **kwargs):
+        if metrics.sinks:
+            return await _instrumented(func, self, ctx, argument, *args, **kwargs)
+        return await func(self, ctx, argument, *args, **kwargs)
+
+    return convert
+
+
+def cached_resolution(func):
+    """
+    Decorates a converter's ``convert`` so its results go through the bot's resolution cache, if one is enabled
+    with :func:`cache.enable_resolution_cache`. Results the user had to pick in :func:`result_handler` aren't cached.
+
+    Calls are also reported to the :mod:`metrics` sinks, if any were added with :func:`metrics.add_sink`.
+    """
+
+    async def resolve(self, ctx: Context, argument: str):
+        cache: ResolutionCache | None = getattr(ctx.bot, "converters_resolution_cache", None)
+        if cache is None:
+            return await func(self, ctx, argument)
+        key = (self if isinstance(self, type) else type(self), getattr(ctx.guild, "id", None), argument)
+        if (result := cache.get(key)) is not None:
+            note(path="cache")
+            return result
+        token = _prompted.set(False)
+        try:
+            result = await func(self, ctx, argument)
+            if not _prompted.get():
+                cache.set(key, result)
+        finally:
+            _prompted.reset(token)
+        return result
+
+    return functools.wraps(func)(instrumented(resolve))
+
+
 async def result_handler(ctx: Context, result, argument: str):
     """
     Handles the result of a search, allowing for the user to select from multiple results.
+    :class:`FuzzyMatches` are always confirmed by the user, since none of them actually matched.
     """
     if not hasattr(ctx.bot, "converters_original_on_command_error"):
         ctx.bot.converters_original_on_command_error = ctx.bot.on_command_error
         ctx.bot.on_command_error = on_command_error
     if not isinstance(result, Iterable):
         result = [result]
-    if len(result) == 1:
+    fuzzy = isinstance(result, FuzzyMatches)
+    if len(result) == 1 and not fuzzy:
         return result[0]
     if len(result) < 1:
         raise BadArgument(
             "Your argument was invalid and somehow made it all the way to the multiple-result handler, please DM clari7744 (642416218967375882) and provide the context that caused this to happen."
         )
-    if len(result) > 20:
+    if len(result) > MAX_PROMPT_RESULTS:
         raise KillCommand(
             f"Too many matches found for your search `{argument}`. Please refine your search and try again."
         )
-    matchlist = "\n".join(
-        [
-            f"**{i+1}.** {v.mention if not isinstance(v, (discord.User, discord.Member, discord.Color, discord.CategoryChannel)) else v} (`{v.id}`){f' (`{v.category}`)' if getattr(v, 'category', None) else ''}"
-            for i, v in enumerate(result)
-        ]
-    )
+    _prompted.set(True)
+    note(prompted=True)
     t = re.match(r"<class 'discord\..+?\.(.+?)'>", str(type(result[0]))).group(1).lower().replace("chan", " chan")
-    todel = await ctx.channel.send(
-        f"There were multiple matches for your search `{argument}`. Please send the number of the correct {t} below, or `cancel` this command and refine your search.\n\n{matchlist}",
-        delete_after=22,
-        allowed_mentions=discord.AllowedMentions().none(),
-    )
-    msg: discord.Message = None
-    try:
-        # TODO: use a select menu instead of wait_for(message)
-        msg = await ctx.bot.wait_for(
-            "message",
-            timeout=20,
-            check=lambda m: (m.content.isdigit() or m.content.lower() in ["cancel"])
-            and m.author == ctx.author
-            and m.channel == ctx.channel,
-        )
-    except asyncio.TimeoutError as e:
-        raise KillCommand("Canceled command due to timeout.") from e
-    finally:
+    if fuzzy:
+        header = f"Couldn't find a {t} matching `{argument}`, did you mean one of these? Please pick the correct {t} below, or cancel this command."
+    else:
+        header = f"There were multiple matches for your search `{argument}`. Please pick the correct {t} below, or cancel this command and refine your search."
+    view = Disambiguation(ctx, list(result), timeout=20)
+    prompt = await ctx.channel.send(header, view=view, allowed_mentions=discord.AllowedMentions().none())
+    choice = await view.run()
+    if view.cancelled:
+        raise KillCommand("Canceled command.")
+    if choice is None:
         try:
-            await todel.delete()
-            await msg.delete()
+            await prompt.edit(content=f"{header}\n\nTimed out.", view=None)
         except discord.HTTPException:
             pass
-    if msg.content.lower() in ["cancel"]:
-        raise KillCommand("Canceled command.")
-    try:
-        num = int(msg.content)
-    except ValueError:
-        raise KillCommand(f"`{msg.content}` is not a number. Canceled command.")
-    if num > len(result) or num == 0:
-        raise KillCommand(f"`{num}` {'is too big' if num != 0 else 'cannot be zero'}. Canceled command.")
-    result = result[num - 1]
-    return result
+        raise KillCommand("Canceled command due to timeout.")
+    return choice
 
 
 async def check_bot(
@@ -245,34 +545,97 @@ async def check_bot(
     return result
 
 
-class Member(MemberConverter, discord.Member):
+MAX_CONCURRENT_CHUNKS = 2
+member_lookup_timings = Timings()
+_chunk_tasks: dict[int, asyncio.Task] = {}
+_chunk_semaphore: asyncio.Semaphore | None = None
+
+
+async def _chunk(guild: discord.Guild):
+    global _chunk_semaphore
+    if _chunk_semaphore is None:
+        _chunk_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+    try:
+        async with _chunk_semaphore:
+            if not guild.chunked:
+                with member_lookup_timings.time("chunk"):
+                    await guild.chunk()
+    except Exception as e:
+        log.error(traceback.format_exception(type(e), e, e.__traceback__))
+    finally:
+        _chunk_tasks.pop(guild.id, None)
+
+
+def schedule_chunk(guild: discord.Guild):
+    """
+    Chunks a guild in the background, unless it's already chunked or being chunked, or the bot
+    doesn't have the members intent (without it, chunking isn't possible).
+    At most :data:`MAX_CONCURRENT_CHUNKS` guilds are chunked at once.
+    """
+    if guild.chunked or guild.id in _chunk_tasks or not guild._state._intents.members:
+        return
+    _chunk_tasks[guild.id] = asyncio.create_task(_chunk(guild))
+
+
+async def _query_member_by_id(bot: Bot, guild: discord.Guild, user_id: int) -> discord.Member | None:
+    """
+    Like :meth:`MemberConverter.query_member_by_id`, but only returns None when the member doesn't exist
+    (the gateway query came back empty, or REST answered 404). Other HTTP errors and gateway timeouts are raised,
+    so a failed lookup isn't mistaken for a missing member.
+    """
+    cache = guild._state.member_cache_flags.joined
+    if bot._get_websocket(shard_id=guild.shard_id).is_ratelimited():
+        # Querying the gateway would wait out the rate limit, REST answers right away
+        try:
+            member = await guild.fetch_member(user_id)
+        except discord.NotFound:
+            return None
+        if cache:
+            guild._add_member(member)
+        return member
+    members = await guild.query_members(limit=1, user_ids=[user_id], cache=cache)
+    return members[0] if members else None
+
+
+class Member(FuzzyConverter, MemberConverter, discord.Member):
     """
     Custom converter to allow for looser searching, inherits from commands.MemberConverter
     """
 
     mem_type: Literal["EITHER", "MEMBER", "BOT"] = "EITHER"
+    query_limit: int = 10
 
-    @staticmethod
-    async def query_member_named(guild: discord.Guild, argument, mem_type="EITHER"):
-        if not guild.chunked:
-            await guild.chunk()
-        result = None
+    @classmethod
+    async def query_member_named(cls, guild: discord.Guild, argument, mem_type="EITHER", **kwargs):
+        """
+        Searches a guild's members by name.
+
+        If the guild isn't chunked yet, this doesn't wait for it: chunking is scheduled in the background
+        (if the bot has the members intent, which chunking needs) and the answer comes from a gateway
+        prefix query of up to ``query_limit`` members plus whatever is already cached.
+        Once the guild is chunked, lookups are answered from the member name index.
+        Time spent on each path is recorded in :data:`member_lookup_timings` as ``cache``, ``query`` and ``chunk``.
+        """
+        username, discriminator = argument, None
         if len(argument) > 5 and argument[-5] == "#":
             username, _, discriminator = argument.rpartition("#")
-            result = search(
-                username,
-                guild.members,
-                "name",
-                "display_name",
-                discrim=discriminator,
-                mem_type=mem_type,
-            )
-        else:
-            #            members = await guild.query_members(argument, limit=100, cache=cache)
-            result = search(argument, guild.members, "name", "display_name", mem_type=mem_type)
-        return result
+        if not guild.chunked:
+            schedule_chunk(guild)
+            with member_lookup_timings.time("query"):
+                note_fallback("query_members")
+                try:
+                    members = await guild.query_members(username, limit=cls.query_limit, cache=True)
+                except (asyncio.TimeoutError, ValueError):
+                    members = []
+                index = get_member_index(guild._state._get_client()).get(guild)
+                for member in members:
+                    index.add(member)
+                return search_members(guild, username, discrim=discriminator, mem_type=mem_type, **kwargs)
+        with member_lookup_timings.time("cache"):
+            return search_members(guild, username, discrim=discriminator, mem_type=mem_type, **kwargs)
 
     @classmethod
+    @cached_resolution
     async def convert(cls, ctx: Context, argument: str) -> discord.Member:  # , *, mem_type="EITHER"
         bot = ctx.bot
         mem_type = cls.mem_type
@@ -285,11 +648,9 @@ class Member(MemberConverter, discord.Member):
             if guild:
                 if len(argument) > 5 and argument[-5] == "#":
                     potential_discriminator = argument[-4:]
-                    result = search(
+                    result = search_members(
+                        guild,
                         argument[:-5],
-                        guild.members,
-                        "name",
-                        "display_name",
                         discrim=potential_discriminator,
                         mem_type=mem_type,
                     )
@@ -305,9 +666,16 @@ class Member(MemberConverter, discord.Member):
             if guild is None:
                 raise MemberNotFound(argument)
             if user_id is not None:
-                result = await MemberConverter().query_member_by_id(bot, guild, user_id)
+                note_fallback("query_member_by_id")
+                try:
+                    result = await get_single_flight(bot).run(
+                        ("member", guild.id, user_id), lambda: _query_member_by_id(bot, guild, user_id)
+                    )
+                except (discord.HTTPException, asyncio.TimeoutError):
+                    # Not remembered as missing, the next lookup tries again
+                    result = None
             else:
-                result = await cls.query_member_named(guild, argument)
+                result = await cls.query_member_named(guild, argument, mem_type=mem_type, **cls.fuzzy_kwargs())
             if not result:
                 raise MemberNotFound(argument)
         if isinstance(result, discord.Member):
@@ -333,7 +701,7 @@ class HumanMember(Member):
 #        return await Member.convert(ctx, argument, mem_type="HUMAN")
 
 
-class User(UserConverter, discord.User):
+class User(FuzzyConverter, UserConverter, discord.User):
     """
     Custom converter to allow for looser searching, inherits from commands.UserConverter
     """
@@ -341,6 +709,7 @@ class User(UserConverter, discord.User):
     mem_type: Literal["EITHER", "MEMBER", "BOT"] = "EITHER"
 
     @classmethod
+    @cached_resolution
     async def convert(cls, ctx: Context, argument) -> discord.User:  # , *, mem_type="EITHER"
         bot = ctx.bot
         mem_type = cls.mem_type
@@ -350,10 +719,13 @@ class User(UserConverter, discord.User):
             user_id = int(match.group(1))
             result = bot.get_user(user_id) or _utils_get(ctx.message.mentions, id=user_id)
             if result is None:
+                note_fallback("fetch_user")
                 try:
-                    result = await bot.fetch_user(user_id)
+                    result = await get_single_flight(bot).run(("user", user_id), lambda: fetch_user(bot, user_id))
                 except discord.HTTPException:
-                    raise UserNotFound(argument) from None
+                    result = None
+                if result is None:
+                    raise UserNotFound(argument)
             return await check_bot(argument, result, "User", mem_type=mem_type)
         arg = argument
         # Remove the '@' character if this is the first character from the argument
@@ -363,18 +735,12 @@ class User(UserConverter, discord.User):
         # check for discriminator if it exists,
         if len(arg) > 5 and arg[-5] == "#":
             name, _, discrim = arg.rpartition("#")
-            result = search(
-                argument,
-                tuple(bot.users),
-                "name",
-                discrim=discrim,
-                mem_type=mem_type,
-            )
+            result = search_users(bot, name, discrim=discrim, mem_type=mem_type)
             if result is not None:
                 if isinstance(result, (discord.User, discord.ClientUser)):
                     return await check_bot(argument, result, "User", mem_type=mem_type)
                 return await result_handler(ctx, result, argument)
-        result = search(argument, tuple(bot.users), "name", mem_type=mem_type)
+        result = search_users(bot, arg, mem_type=mem_type, **cls.fuzzy_kwargs())
         if result is None:
             raise UserNotFound(argument)
         if isinstance(result, (discord.User, discord.ClientUser)):
@@ -400,12 +766,191 @@ class HumanUser(User):
 #        return await User.convert(ctx, argument, mem_type="HUMAN")
 
 
-class Role(RoleConverter, discord.Role):
+class BulkConversion(list):
+    """
+    The objects a bulk converter resolved, in input order.
+
+    Attributes
+    ----------
+    results : List[Tuple[str, Any]]
+        Every argument, in input order, paired with what it resolved to or the error it failed with
+    """
+
+    def __init__(self, results: List[Tuple[str, object]]):
+        self.results = results
+        super().__init__(result for _, result in results if not isinstance(result, Exception))
+
+    @property
+    def errors(self) -> List[Tuple[str, BadArgument]]:
+        """
+        The arguments that failed to convert, paired with their errors.
+        """
+        return [(argument, result) for argument, result in self.results if isinstance(result, Exception)]
+
+
+def _split_arguments(argument: str) -> List[str]:
+    return [quoted or bare for quoted, bare in re.findall(r'"([^"]+)"|([^\s,]+)', argument)]
+
+
+async def query_members_by_id(bot: Bot, guild: discord.Guild, user_ids: List[int]) -> dict[int, discord.Member]:
+    """
+    Fetches the members with the given IDs, using one gateway query per 100 IDs
+    (or REST, one ID at a time, if the gateway is rate limited).
+    """
+    cache = guild._state.member_cache_flags.joined
+    found: dict[int, discord.Member] = {}
+    if bot._get_websocket(shard_id=guild.shard_id).is_ratelimited():
+        note_fallback("fetch_member")
+        members = await asyncio.gather(*(guild.fetch_member(i) for i in user_ids), return_exceptions=True)
+        for member in members:
+            if isinstance(member, discord.Member):
+                if cache:
+                    guild._add_member(member)
+                found[member.id] = member
+        return found
+    note_fallback("query_members")
+    for i in range(0, len(user_ids), 100):
+        try:
+            members = await guild.query_members(limit=100, user_ids=user_ids[i : i + 100], cache=cache)  # noqa: E203
+        except asyncio.TimeoutError:
+            continue
+        found.update((member.id, member) for member in members)
+    return found
+
+
+class MemberList(commands.Converter):
+    """
+    Converts several members at once, e.g. ``!ban @a @b 1234 5678 "some name"``.
+
+    IDs and mentions are looked up in the cache in one pass, and the rest are fetched with as few
+    gateway member queries as possible. Names go through :class:`Member` one by one.
+    Returns a :class:`BulkConversion` in input order; arguments that couldn't be converted are in its ``errors``.
+
+    The parameter must be keyword-only, so it consumes the rest of the message; a positional one only gets
+    the first word.
+
+    Examples
+    --------
+    .. code-block:: python3
+
+        @bot.command()
+        async def ban(ctx, *, members: MemberList):
+            for member in members:
+                await member.ban()
+            if members.errors:
+                await ctx.send(f"Couldn't find {', '.join(argument for argument, _ in members.errors)}")
+    """
+
+    converter: Type[Member] = Member
+
+    @classmethod
+    @instrumented
+    async def convert(cls, ctx: Context, argument: str) -> BulkConversion:
+        note(path="bulk")
+        guild = ctx.guild
+        if guild is None:
+            raise NoPrivateMessage()
+        mem_type = cls.converter.mem_type
+        arguments = _split_arguments(argument)
+        results: List[object] = [None] * len(arguments)
+        missing: dict[int, List[int]] = {}
+        for i, arg in enumerate(arguments):
+            match = IDConverter._get_id_match(arg) or re.match(r"<@!?([0-9]{15,20})>$", arg)
+            if match is None:
+                continue
+            user_id = int(match.group(1))
+            results[i] = guild.get_member(user_id) or _utils_get(ctx.message.mentions, id=user_id)
+            if not isinstance(results[i], discord.Member):
+                missing.setdefault(user_id, []).append(i)
+        if missing:
+            found = await query_members_by_id(ctx.bot, guild, list(missing))
+            for user_id, positions in missing.items():
+                for i in positions:
+                    results[i] = found.get(user_id, MemberNotFound(arguments[i]))
+        for i, arg in enumerate(arguments):
+            try:
+                if results[i] is None:
+                    results[i] = await cls.converter.convert(ctx, arg)
+                elif not isinstance(results[i], Exception):
+                    results[i] = await check_bot(arg, results[i], "Member", mem_type=mem_type)
+            except BadArgument as e:
+                results[i] = e
+        return BulkConversion(list(zip(arguments, results)))
+
+
+class UserList(commands.Converter):
+    """
+    Converts several users at once, like :class:`MemberList`.
+
+    IDs and mentions are looked up in the cache in one pass. In a guild, the rest are fetched as members
+    with batched gateway queries, and anything still missing is fetched over REST concurrently.
+    Members found by the gateway queries are returned as their :class:`discord.User`.
+    Returns a :class:`BulkConversion` in input order.
+
+    Like :class:`MemberList`, the parameter must be keyword-only to consume the rest of the message.
+
+    Examples
+    --------
+    .. code-block:: python3
+
+        @bot.command()
+        async def whois(ctx, *, users: UserList):
+            await ctx.send(", ".join(f"{user} ({user.id})" for user in users))
+    """
+
+    converter: Type[User] = User
+
+    @classmethod
+    @instrumented
+    async def convert(cls, ctx: Context, argument: str) -> BulkConversion:
+        note(path="bulk")
+        bot = ctx.bot
+        mem_type = cls.converter.mem_type
+        arguments = _split_arguments(argument)
+        results: List[object] = [None] * len(arguments)
+        missing: dict[int, List[int]] = {}
+        for i, arg in enumerate(arguments):
+            match = IDConverter._get_id_match(arg) or re.match(r"<@!?([0-9]+)>$", arg)
+            if match is None:
+                continue
+            user_id = int(match.group(1))
+            results[i] = bot.get_user(user_id) or _utils_get(ctx.message.mentions, id=user_id)
+            if results[i] is None:
+                missing.setdefault(user_id, []).append(i)
+        found: dict[int, discord.abc.User] = {}
+        if missing and ctx.guild is not None:
+            # the gateway answers with members, but this converter returns users, like User.convert
+            members = await query_members_by_id(bot, ctx.guild, list(missing))
+            found.update((user_id, member._user) for user_id, member in members.items())
+        if remaining := [i for i in missing if i not in found]:
+            note_fallback("fetch_user")
+            flight = get_single_flight(bot)
+            fetched = await asyncio.gather(
+                *(flight.run(("user", i), functools.partial(fetch_user, bot, i)) for i in remaining),
+                return_exceptions=True,
+            )
+            found.update((user.id, user) for user in fetched if isinstance(user, discord.User))
+        for user_id, positions in missing.items():
+            for i in positions:
+                results[i] = found.get(user_id, UserNotFound(arguments[i]))
+        for i, arg in enumerate(arguments):
+            try:
+                if results[i] is None:
+                    results[i] = await cls.converter.convert(ctx, arg)
+                elif not isinstance(results[i], Exception):
+                    results[i] = await check_bot(arg, results[i], "User", mem_type=mem_type)
+            except BadArgument as e:
+                results[i] = e
+        return BulkConversion(list(zip(arguments, results)))
+
+
+class Role(FuzzyConverter, RoleConverter, discord.Role):
     """
     Custom converter to allow for looser searching, inherits from commands.RoleConverter
     """
 
     @classmethod
+    @cached_resolution
     async def convert(cls, ctx: Context, argument):
         guild = ctx.guild
         if not guild:
@@ -414,7 +959,7 @@ class Role(RoleConverter, discord.Role):
         if match:
             result = guild.get_role(int(match.group(1)))
         else:
-            result = search(argument, tuple(guild.roles), "name")
+            result = search(argument, tuple(guild.roles), "name", **cls.fuzzy_kwargs())
         if result is None:
             raise RoleNotFound(argument)
         if isinstance(result, discord.Role):
@@ -423,40 +968,37 @@ class Role(RoleConverter, discord.Role):
 
 
 class Color(ColorConverter, discord.Color):
+    """
+    A converter to convert a string to a discord.Color object.
+    See :func:`~DPyUtils.colors.parse_color_value` for the accepted formats.
+    """
+
     @classmethod
+    @instrumented
     async def convert(cls, ctx: Context, argument):
-        clr = discord.colour
-        try:
-            int_arg = int(argument)
-            return discord.Color(int_arg)
-        except ValueError:
-            pass
-        if argument[0] == "#":
-            return clr.parse_hex_number(argument[1:])
-        if argument[0:2] == "0x":
-            rest = argument[2:]
-            # Legacy backwards compatible syntax
-            if rest.startswith("#"):
-                return clr.parse_hex_number(rest[1:])
-            return clr.parse_hex_number(rest)
-        arg = argument.lower()
-        if arg[0:3] == "rgb":
-            return clr.parse_rgb(arg)
-        arg = arg.replace(" ", "_")
-        try:
-            return clr.parse_hex_number(argument)
-        except ValueError:
-            pass
-        method = getattr(discord.Colour, arg, None)
-        if arg.startswith("from_") or method is None or not inspect.ismethod(method):
-            raise BadColorArgument(arg)
-        return method()
+        note(path="parse")
+        return parse_color(argument)
 
 
 class Emoji(EmojiConverter):
+    """
+    Converts to a :class:`discord.Emoji` by ID, ``<:name:id>`` or name, using the bot's :class:`~DPyUtils.indexes.EmojiIndex`.
+    Names are matched ignoring case, preferring the current guild's emojis and then exact-case matches.
+    """
+
+    @cached_resolution
     async def convert(self, ctx: Context, argument):
         # https://gist.github.com/Phxntxm/a91e0cfadb19b2071554d59edcd1df6c
-        return await super().convert(ctx, argument)
+        index = get_emoji_index(ctx.bot)
+        match = self._get_id_match(argument) or re.match(r"<a?:[a-zA-Z0-9\_]{1,32}:([0-9]{15,20})>$", argument)
+        if match is None:
+            note(path="name")
+            result = index.first(argument.strip(":"), ctx.guild and ctx.guild.id)
+        else:
+            result = index.get(int(match.group(1)))
+        if result is None:
+            raise EmojiNotFound(argument)
+        return result
 
 
 class Guild(GuildConverter):
@@ -464,16 +1006,6 @@ class Guild(GuildConverter):
         return await super().convert(ctx, argument)
 
 
-def get_all(bot, thing):
-    def _get_all(self):
-        for guild in self.guilds:
-            for channel in getattr(guild, thing):
-                yield channel
-
-    if not getattr(bot, f"get_all_{thing}", False):
-        setattr(bot, f"get_all_{thing}", _get_all)
-
-
 class GuildChannel(GuildChannelConverter):
     @staticmethod
     async def _resolve_channel(
@@ -483,24 +1015,18 @@ class GuildChannel(GuildChannelConverter):
         _type: Type[CT],
         *,
         news=False,
+        **kwargs,
     ):
         bot: Bot = ctx.bot
-        for t in "categories text_channels voice_chanmels stage_channels".split():
-            get_all(bot, t)
         match = IDConverter._get_id_match(argument) or re.match(r"<#([0-9]{15,20})>$", argument)
         result = None
         guild = ctx.guild
         if match is None:
             # not a mention
-            if guild:
-                iterable: Iterable[CT] = getattr(guild, attribute)
-                result = search(argument, iterable, "name")
-            else:
-                result = search(
-                    argument,
-                    getattr(bot, f"get_all_{attribute}", bot.get_all_channels)(),
-                    "name",
-                )
+            directory = get_channel_directory(bot)
+            iterable: Iterable[CT] = directory.get(guild, attribute) if guild else directory.all(attribute)
+            if iterable:
+                result = search(argument, iterable, "name", **kwargs)
         else:
             channel_id = int(match.group(1))
             if guild:
@@ -516,101 +1042,226 @@ class GuildChannel(GuildChannelConverter):
                 raise ChannelNotFound(argument)
             return result
         if news:
-            result = [c for c in result if c.is_news()]
+            result = type(result)(c for c in result if c.is_news())
+            if not result:
+                raise ChannelNotFound(argument)
         if isinstance(result, _type):
             return result
         return await result_handler(ctx, result, argument)
 
     @staticmethod
-    async def _resolve_thread(ctx: Context, argument: str, attribute: str, _type: Type[TT]):
+    async def _resolve_thread(
+        ctx: Context, argument: str, attribute: str, _type: Type[TT], *, archive_pages: int = 0, **kwargs
+    ):
         bot: Bot = ctx.bot
-        get_all(bot, "threads")
         match = IDConverter._get_id_match(argument) or re.match(r"<#([0-9]{15,20})>$", argument)
         result = None
         guild = ctx.guild
         if match is None:
             # not a mention
-            if guild:
-                iterable: Iterable[TT] = getattr(guild, attribute)
-                result = search(argument, iterable, "name")
-            else:
-                result = search(
-                    argument,
-                    getattr(bot, f"get_all_{attribute}", bot.get_all_channels)(),
-                    "name",
-                )
+            directory = get_channel_directory(bot)
+            iterable: Iterable[TT] = directory.get(guild, attribute) if guild else directory.all(attribute)
+            if iterable:
+                result = search(argument, iterable, "name", **kwargs)
+            if guild and archive_pages and (result is None or isinstance(result, FuzzyMatches)):
+                note_fallback("archived_threads")
+                result = await GuildChannel._resolve_archived_thread(ctx, argument, archive_pages, **kwargs) or result
         else:
             thread_id = int(match.group(1))
             if guild:
                 result = guild.get_thread(thread_id)
+                if result is None and archive_pages:
+                    # Archived threads aren't cached
+                    note_fallback("fetch_channel")
+                    try:
+                        result = await guild.fetch_channel(thread_id)
+                    except (discord.NotFound, discord.Forbidden):
+                        pass
             if not isinstance(result, _type):
                 raise ThreadNotFound(argument)
-        if result is None or not isinstance(result, _type):
+        if result is None:
             raise ThreadNotFound(argument)
-
+        if isinstance(result, _type):
+            return result
         return await result_handler(ctx, result, argument)
 
+    @staticmethod
+    async def _resolve_archived_thread(ctx: Context, argument: str, budget: int, **kwargs):
+        """
+        Searches the public archived threads of the guild's channels, starting with the current channel,
+        taking one page from each channel in turn. Stops at the first exact name match, or once ``budget``
+        pages had to be fetched; pages cached by :class:`~DPyUtils.cache.ArchivedThreadCache` are free.
+        """
+        guild = ctx.guild
+        archives = get_archived_thread_cache(ctx.bot)
+        current = ctx.channel.parent if isinstance(ctx.channel, discord.Thread) else ctx.channel
+        parents = get_channel_directory(ctx.bot).get(guild, "text_channels", "forums")
+        if current in parents:
+            parents = (current, *(parent for parent in parents if parent != current))
+        me = guild.me
+        pagers = [archives.pages(parent) for parent in parents if parent.permissions_for(me).read_message_history]
+        seen: List[discord.Thread] = []
+        try:
+            while pagers and budget > 0:
+                for pager in list(pagers):
+                    try:
+                        page, fetched = await anext(pager)
+                    except (StopAsyncIteration, discord.HTTPException):
+                        pagers.remove(pager)
+                        continue
+                    budget -= fetched
+                    exact = [thread for thread in page if thread.name == argument]
+                    if exact:
+                        return exact[0] if len(exact) == 1 else exact
+                    seen.extend(page)
+                    if budget <= 0:
+                        break
+        finally:
+            for pager in pagers:
+                await pager.aclose()
+        return search(argument, seen, "name", **kwargs) if seen else None
+
+
+class CategoryChannel(FuzzyConverter, CategoryChannelConverter, discord.CategoryChannel):
+    channel_attribute = "categories"
+    channel_type = discord.CategoryChannel
 
-class CategoryChannel(CategoryChannelConverter, discord.CategoryChannel):
     @classmethod
+    @cached_resolution
     async def convert(cls, ctx: Context, argument: str) -> discord.CategoryChannel:
-        return await GuildChannel._resolve_channel(ctx, argument, "categories", discord.CategoryChannel)
+        return await GuildChannel._resolve_channel(
+            ctx, argument, cls.channel_attribute, cls.channel_type, **cls.fuzzy_kwargs()
+        )
+
 
+class TextChannel(FuzzyConverter, TextChannelConverter, discord.TextChannel):
+    channel_attribute = "text_channels"
+    channel_type = discord.TextChannel
 
-class TextChannel(TextChannelConverter, discord.TextChannel):
     @classmethod
-    async def convert(cls, ctx: Context, argument: str) -> discord.CategoryChannel:
-        return await GuildChannel._resolve_channel(ctx, argument, "text_channels", discord.TextChannel)
+    @cached_resolution
+    async def convert(cls, ctx: Context, argument: str) -> discord.TextChannel:
+        return await GuildChannel._resolve_channel(
+            ctx, argument, cls.channel_attribute, cls.channel_type, **cls.fuzzy_kwargs()
+        )
 
 
-class NewsChannel(TextChannelConverter, discord.TextChannel):
+class NewsChannel(FuzzyConverter, TextChannelConverter, discord.TextChannel):
+    channel_attribute = "text_channels"
+    channel_type = discord.TextChannel
+    news = True
+
     @classmethod
+    @cached_resolution
     async def convert(cls, ctx: Context, argument: str) -> discord.TextChannel:
-        return await GuildChannel._resolve_channel(ctx, argument, "text_channels", discord.TextChannel, news=True)
+        return await GuildChannel._resolve_channel(
+            ctx, argument, cls.channel_attribute, cls.channel_type, news=cls.news, **cls.fuzzy_kwargs()
+        )
+
 
+class ForumChannel(FuzzyConverter, ForumChannelConverter, discord.ForumChannel):
+    channel_attribute = "forums"
+    channel_type = discord.ForumChannel
 
-class ForumChannel(ForumChannelConverter, discord.ForumChannel):
     @classmethod
+    @cached_resolution
     async def convert(cls, ctx: Context, argument: str) -> discord.ForumChannel:
-        return await GuildChannel._resolve_channel(ctx, argument, "forums", discord.ForumChannel)
+        return await GuildChannel._resolve_channel(
+            ctx, argument, cls.channel_attribute, cls.channel_type, **cls.fuzzy_kwargs()
+        )
+
 
+class VoiceChannel(FuzzyConverter, VoiceChannelConverter, discord.VoiceChannel):
+    channel_attribute = "voice_channels"
+    channel_type = discord.VoiceChannel
 
-class VoiceChannel(VoiceChannelConverter, discord.VoiceChannel):
     @classmethod
+    @cached_resolution
     async def convert(cls, ctx: Context, argument: str) -> discord.VoiceChannel:
-        return await GuildChannel._resolve_channel(ctx, argument, "voice_channels", discord.VoiceChannel)
+        return await GuildChannel._resolve_channel(
+            ctx, argument, cls.channel_attribute, cls.channel_type, **cls.fuzzy_kwargs()
+        )
+
 
+class StageChannel(FuzzyConverter, StageChannelConverter, discord.StageChannel):
+    channel_attribute = "stage_channels"
+    channel_type = discord.StageChannel
 
-class StageChannel(StageChannelConverter, discord.StageChannel):
     @classmethod
+    @cached_resolution
     async def convert(cls, ctx: Context, argument: str) -> discord.StageChannel:
-        return await GuildChannel._resolve_channel(ctx, argument, "stage_channels", discord.StageChannel)
+        return await GuildChannel._resolve_channel(
+            ctx, argument, cls.channel_attribute, cls.channel_type, **cls.fuzzy_kwargs()
+        )
+
+
+class Thread(FuzzyConverter, ThreadConverter, discord.Thread):
+    """
+    Resolves active threads like the other channel converters. If none match, it falls back to fetching
+    archived threads by ID, and to searching the public archived threads by name, fetching at most
+    ``archive_pages`` pages of archives per lookup (set it to 0 to turn the fallback off).
+    """
 
+    channel_attribute = "threads"
+    channel_type = discord.Thread
+    archive_pages = 10
 
-class Thread(ThreadConverter, discord.Thread):
     @classmethod
+    @cached_resolution
     async def convert(cls, ctx: Context, argument: str) -> discord.Thread:
         if not v2:
             raise commands.CheckFailure("Sorry, you can't use this until v2")
-        return await GuildChannel._resolve_thread(ctx, argument, "threads", discord.Thread)
+        return await GuildChannel._resolve_thread(
+            ctx,
+            argument,
+            cls.channel_attribute,
+            cls.channel_type,
+            archive_pages=cls.archive_pages,
+            **cls.fuzzy_kwargs(),
+        )
+
 
+class AnyChannelBase(FuzzyConverter, commands.Converter):
+    """
+    Resolves a channel of any of the types handled by ``converters`` in one go.
+
+    The mention or ID is parsed once, and names are searched once across a combined, cached list of
+    every allowed channel type, so matches of different types are ranked against each other.
+    """
 
-class AnyChannelBase(commands.Converter):
     converters: list
 
     @classmethod
+    @instrumented
     async def convert(cls, ctx: Context, argument, converters=[]):
         converters = converters or cls.converters
-        result = None
-        for converter in converters:
-            if result:
-                break
-            try:
-                result = await converter().convert(ctx, argument)
-            except Exception:
-                continue
-        if not result:
+        bot: Bot = ctx.bot
+        guild = ctx.guild
+        allowed = [(c.channel_type, getattr(c, "news", False)) for c in converters]
+
+        def check(channel):
+            return any(isinstance(channel, t) and (not news or channel.is_news()) for t, news in allowed)
+
+        match = IDConverter._get_id_match(argument) or re.match(r"<#([0-9]{15,20})>$", argument)
+        if match is not None:
+            channel_id = int(match.group(1))
+            if guild:
+                result = guild.get_channel_or_thread(channel_id)
+            else:
+                result = _get_from_guilds(bot, "get_channel", channel_id)
+            if result is None or not check(result):
+                raise ChannelNotFound(argument)
+            return result
+        directory = get_channel_directory(bot)
+        attributes = tuple(dict.fromkeys(c.channel_attribute for c in converters))
+        iterable = directory.get(guild, *attributes) if guild else directory.all(*attributes)
+        if any(news for _, news in allowed):
+            iterable = tuple(filter(check, iterable))
+        result = search(argument, iterable, "name", **cls.fuzzy_kwargs()) if iterable else None
+        if result is None:
             raise ChannelNotFound(argument)
+        if isinstance(result, list):
+            return await result_handler(ctx, result, argument)
         return result
 
 
@@ -631,24 +1282,138 @@ class NonCategoryChannel(AnyChannelBase):
 class Message(MessageConverter):
     @classmethod
     async def convert(cls, ctx: Context, argument):
-        await cls().convert(ctx, argument.strip("<>"))
+        return await MessageConverter().convert(ctx, argument.strip("<>"))
+
+
+async def fetch_messages(channel: discord.abc.Messageable, message_ids: Iterable[int]) -> dict[int, discord.Message]:
+    """
+    Fetches the messages with the given IDs from one channel, walking its history in pages of 100
+    instead of fetching each message on its own. IDs that are close together share a page; a lone ID
+    is fetched directly. Messages that don't exist are left out of the result.
+
+    Raises
+    ------
+    discord.Forbidden
+        The bot can't read the channel's history
+    """
+    remaining = sorted(set(message_ids))
+    found: dict[int, discord.Message] = {}
+    i = 0
+    while i < len(remaining):
+        if i == len(remaining) - 1:
+            try:
+                found[remaining[i]] = await channel.fetch_message(remaining[i])
+            except discord.NotFound:
+                pass
+            break
+        page = [m async for m in channel.history(limit=100, after=discord.Object(remaining[i] - 1), oldest_first=True)]
+        for message in page:
+            found[message.id] = message
+        # Everything up to the last message of a full page has been seen, and a short page means the channel ended
+        covered = page[-1].id if len(page) == 100 else float("inf")
+        while i < len(remaining) and remaining[i] <= covered:
+            i += 1
+    return {message_id: found[message_id] for message_id in remaining if message_id in found}
+
+
+class MessageList(commands.Converter):
+    """
+    Converts several message links or IDs at once, e.g. ``!report <link> <link> 1234-5678``.
+
+    Arguments are grouped by channel, messages in the client's message cache are used as-is,
+    and the rest are fetched with :func:`fetch_messages`, one history page per 100 nearby messages,
+    with every channel fetched concurrently. Returns a :class:`BulkConversion` in input order.
+
+    Like :class:`MemberList`, the parameter must be keyword-only (``*, messages: MessageList``)
+    to consume the rest of the message.
+    """
+
+    @classmethod
+    @instrumented
+    async def convert(cls, ctx: Context, argument: str) -> BulkConversion:
+        note(path="bulk")
+        arguments = _split_arguments(argument)
+        results: List[object] = [None] * len(arguments)
+        get_message = ctx.bot._connection._get_message
+        # (guild_id, channel_id) -> message_id -> positions
+        wanted: dict[Tuple[int | None, int], dict[int, List[int]]] = {}
+        for i, arg in enumerate(arguments):
+            try:
+                guild_id, message_id, channel_id = PartialMessageConverter._get_id_matches(ctx, arg.strip("<>"))
+            except BadArgument as e:
+                results[i] = e
+                continue
+            results[i] = get_message(message_id)
+            if results[i] is None:
+                wanted.setdefault((guild_id, channel_id), {}).setdefault(message_id, []).append(i)
+
+        async def resolve(guild_id: int | None, channel_id: int, messages: dict[int, List[int]]):
+            channel = PartialMessageConverter._resolve_channel(ctx, guild_id, channel_id)
+            if not channel or not isinstance(channel, discord.abc.Messageable):
+                error = ChannelNotFound(str(channel_id))
+                found = {}
+            else:
+                try:
+                    found = await fetch_messages(channel, messages)
+                    error = None
+                except discord.Forbidden:
+                    error = ChannelNotReadable(channel)
+                    found = {}
+            for message_id, positions in messages.items():
+                for i in positions:
+                    results[i] = found.get(message_id) or error or MessageNotFound(arguments[i])
+
+        await asyncio.gather(*(resolve(*key, messages) for key, messages in wanted.items()))
+        return BulkConversion(list(zip(arguments, results)))
 
 
 class IgnoreCaseLiteral(commands.Converter, app_commands.Transformer):
     """
     A converter to ensure that the argument is one of the specified literals, ignoring case.
+
+    Every ``IgnoreCaseLiteral[...]`` is its own (cached) subclass. Up to 25 options are offered as
+    slash command choices, larger sets get autocomplete instead.
+
+    Examples
+    --------
+    .. code-block:: python3
+
+        @bot.hybrid_command()
+        async def timezone(ctx, zone: IgnoreCaseLiteral[tuple(zoneinfo.available_timezones())]):
+            ...
     """
 
+    parameters: Tuple[str, ...] = ()
+    options: frozenset = frozenset()
+    _display: Tuple[str, ...] = ()
+    _trie: PrefixTrie = PrefixTrie()
+    _parameterizations: dict = {}
+
     def __class_getitem__(cls, parameters: str | Tuple[str]):
         if isinstance(parameters, str):
             parameters = (parameters,)
-        cls.parameters = tuple(str(param).lower() for param in parameters)
-        return cls
+        key = (cls, tuple(map(str, parameters)))
+        if (literal := cls._parameterizations.get(key)) is not None:
+            return literal
+        display = tuple(dict.fromkeys(key[1]))
+        namespace = {
+            "__module__": cls.__module__,
+            "parameters": tuple(param.lower() for param in display),
+            "options": frozenset(param.lower() for param in display),
+            "_display": display,
+            "_trie": PrefixTrie(sorted(display, key=str.casefold), 25),
+        }
+        if len(display) > 25:
+            namespace["autocomplete"] = cls._autocomplete
+        literal = cls._parameterizations[key] = type(
+            f"{cls.__name__}[{trim(', '.join(display), 80)}]", (cls,), namespace
+        )
+        return literal
 
     async def check(self, argument: str):
-        if (lower := str(argument).lower()) in self.parameters:
+        if (lower := str(argument).lower()) in self.options:
             return lower
-        raise BadArgument(f"{argument} is not a valid option!\nOptions: {', '.join(self.parameters)}")
+        raise BadArgument(f"{argument} is not a valid option!\nOptions: {trim(', '.join(self.parameters), 1800)}")
 
     async def convert(self, ctx: Context, argument: str):
         return await self.check(argument)
@@ -658,15 +1423,125 @@ class IgnoreCaseLiteral(commands.Converter, app_commands.Transformer):
 
     @property
     def choices(self):
-        return [app_commands.Choice(name=param, value=param) for param in self.parameters]
+        if len(self._display) > 25:
+            return None
+        return [app_commands.Choice(name=param, value=param) for param in self._display]
+
+    async def _autocomplete(self, interaction: discord.Interaction[discord.Client], value: str):
+        completions = self._trie.complete(value)
+        if not completions and value:
+            # Nothing starts with it, fall back to options that contain it
+            folded = value.casefold()
+            completions = [param for param in self._display if folded in param.casefold()][:25]
+        return [app_commands.Choice(name=param, value=param) for param in completions]
+
+
+class IntSequence(Sequence[int]):
+    """
+    An immutable sequence of integers returned by :class:`IntList`.
+
+    Explicitly listed numbers are packed into ``array('q')`` chunks and ranges are kept as :class:`range`
+    objects, so ``"1-1000000"`` costs a few bytes until it is iterated. Indexing is ``O(log n)`` in the
+    amount of segments.
+    """
+
+    __slots__ = ("_segments", "_offsets")
+    __hash__ = None
+
+    def __init__(self, segments: Iterable[array | range] = ()):
+        self._segments: List[array | range] = [segment for segment in segments if len(segment)]
+        self._offsets = array("q", accumulate((len(segment) for segment in self._segments), initial=0))
+
+    def __len__(self):
+        return self._offsets[-1]
+
+    def __iter__(self):
+        return chain.from_iterable(self._segments)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("IntSequence index out of range")
+        segment = bisect_right(self._offsets, index) - 1
+        return self._segments[segment][index - self._offsets[segment]]
+
+    def __contains__(self, value):
+        return any(value in segment for segment in self._segments)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(map(eq, self, other))
+
+    def __repr__(self):
+        parts = [f"{s.start}..{s[-1]}" if isinstance(s, range) else ", ".join(map(str, s)) for s in self._segments]
+        return f"<IntSequence [{trim(', '.join(parts), 200)}] len={len(self)}>"
+
+    def tolist(self) -> List[int]:
+        return list(self)
+
+
+class _SequenceBuilder:
+    # Packs consecutive explicit numbers into one array, ranges get their own segment
+    def __init__(self):
+        self.segments: List[array | range] = []
+        self.values = array("q")
+
+    def add(self, value: int):
+        self.values.append(value)
+
+    def add_range(self, segment: range):
+        if len(segment) == 1:
+            return self.add(segment[0])
+        if self.values:
+            self.segments.append(self.values)
+            self.values = array("q")
+        self.segments.append(segment)
+
+    def extend(self, values: Iterable[int]):
+        self.values.extend(values)
+
+    def build(self) -> IntSequence:
+        return IntSequence(self.segments + [self.values])
 
 
 class IntList(commands.Converter, app_commands.Transformer):
     """
-    A converter to convert a comma-separated string of integers to a list of integers.
+    A converter to convert a string of integers and ranges to a sequence of integers.
+
+    Numbers are separated by commas and/or whitespace, ranges are written ``start-end`` or ``start..end``
+    and include both ends (``10-1`` counts down). Ranges are expanded lazily, see :class:`IntSequence`;
+    sorting and deduplicating work on whole ranges too, only numbers repeated by a sort are written out.
+
+    Parameters
+    ----------
+    sort : bool
+        Sort the numbers
+    unique : bool
+        Drop repeated numbers, keeping the first
+    max_size : int | None
+        The most numbers the argument may hold, counting every number in its ranges, or None for no limit.
+        Arguments over it are rejected before they're sorted or deduplicated.
+
+    Examples
+    --------
+    .. code-block:: python3
+
+        @bot.command()
+        async def pages(ctx, pages: IntList(sort=True, unique=True)):
+            # !pages 1-3, 7 2..4  ->  1, 2, 3, 4, 7
+            ...
     """
 
-    async def conversion(self, where: Context | Interaction, arg: str):
+    def __init__(self, *, sort: bool = False, unique: bool = False, max_size: int | None = 1_000_000):
+        self.sort = sort
+        self.unique = unique
+        self.max_size = max_size
+
+    async def conversion(self, where: Context | Interaction, arg: str) -> IntSequence:
         """
         The conversion function for the converter.
 
@@ -675,43 +1550,220 @@ class IntList(commands.Converter, app_commands.Transformer):
         where : Union[Context, Interaction]
             The context or interaction where the conversion is taking place.
         arg : str
-            The string to convert - example: "1, 2, 3, 4"
+            The string to convert - example: "1, 2, 3, 4" or "1-5, 10..20"
         """
-        args = "".join(map(str.strip, arg.split(","))).split(" ")
-        intargs = []
-        for i in args:
-            try:
-                intargs.append(int(i))
-            except ValueError as err:
-                raise (app_commands.TransformerError if isinstance(where, Interaction) else BadArgument)(
-                    f"{i} is not an integer!"
-                ) from err
-        return intargs
+        return self.parse(arg)
 
-    async def convert(self, ctx: Context, argument) -> List[int]:
-        await self.conversion(ctx, argument)
+    def parse(self, arg: str) -> IntSequence:
+        """
+        Parses the string in one pass, see :meth:`conversion`.
+        """
+        builder = _SequenceBuilder()
+        for match in _INT_LIST_TOKEN.finditer(arg):
+            start, end, bad = match.groups()
+            if bad is not None:
+                raise BadArgument(f"{bad} is not an integer or range!")
+            if end is None:
+                builder.add(int(start))
+            else:
+                start, end = int(start), int(end)
+                builder.add_range(range(start, end + 1) if start <= end else range(start, end - 1, -1))
+        result = builder.build()
+        if self.max_size is not None and len(result) > self.max_size:
+            raise BadArgument(f"Too many numbers, at most {self.max_size} are allowed!")
+        if self.sort and self.unique:
+            return self._merged(result)
+        if self.sort:
+            return self._sorted(result)
+        if self.unique:
+            return self._deduplicated(result)
+        return result
 
-    async def transform(self, interaction: Interaction, value: str) -> List[int]:
-        await self.conversion(interaction, value)
+    @staticmethod
+    def _intervals(sequence: IntSequence):
+        # Every segment as ascending (start, stop) intervals, sorted by start
+        ranges = []
+        values = array("q")
+        for segment in sequence._segments:
+            if isinstance(segment, range):
+                ranges.append((min(segment[0], segment[-1]), max(segment[0], segment[-1]) + 1))
+            else:
+                values.extend(segment)
+        ranges.sort()
+        return heapq.merge(ranges, ((value, value + 1) for value in sorted(values)))
+
+    @classmethod
+    def _merged(cls, sequence: IntSequence) -> IntSequence:
+        builder = _SequenceBuilder()
+        current = None
+        for start, stop in cls._intervals(sequence):
+            if current is not None and start <= current[1]:
+                current[1] = max(current[1], stop)
+                continue
+            if current is not None:
+                builder.add_range(range(*current))
+            current = [start, stop]
+        if current is not None:
+            builder.add_range(range(*current))
+        return builder.build()
+
+    @staticmethod
+    def _sorted(sequence: IntSequence) -> IntSequence:
+        # Sweeps over the points where segments start and stop: stretches covered by one segment stay
+        # ranges, only the numbers covered several times are written out, once per segment covering them
+        events = []
+        for segment in sequence._segments:
+            if isinstance(segment, range):
+                events += ((min(segment[0], segment[-1]), 1), (max(segment[0], segment[-1]) + 1, -1))
+            else:
+                for value in segment:
+                    events += ((value, 1), (value + 1, -1))
+        events.sort()
+        builder = _SequenceBuilder()
+        depth = 0
+        previous = None
+        for position, delta in events:
+            if depth == 1 and position > previous:
+                builder.add_range(range(previous, position))
+            elif depth > 1 and position > previous:
+                builder.extend(chain.from_iterable(repeat(value, depth) for value in range(previous, position)))
+            depth += delta
+            previous = position
+        return builder.build()
+
+    @staticmethod
+    def _deduplicated(sequence: IntSequence) -> IntSequence:
+        # The numbers seen so far are kept as sorted, disjoint [start, stop) intervals, and every segment
+        # only adds the parts of itself they don't cover yet, in its own direction
+        starts: List[int] = []
+        stops: List[int] = []
+        builder = _SequenceBuilder()
+        for segment in sequence._segments:
+            for part in [segment] if isinstance(segment, range) else (range(value, value + 1) for value in segment):
+                low, high = min(part[0], part[-1]), max(part[0], part[-1]) + 1
+                first = last = bisect_right(stops, low)
+                gaps = []
+                cursor = low
+                while last < len(starts) and starts[last] < high:
+                    if cursor < starts[last]:
+                        gaps.append(range(cursor, starts[last]))
+                    cursor = max(cursor, stops[last])
+                    last += 1
+                if cursor < high:
+                    gaps.append(range(cursor, high))
+                for gap in gaps if part.step > 0 else reversed(gaps):
+                    builder.add_range(gap if part.step > 0 else gap[::-1])
+                if first < last:
+                    low, high = min(low, starts[first]), max(high, stops[last - 1])
+                starts[first:last] = [low]
+                stops[first:last] = [high]
+        return builder.build()
+
+    async def convert(self, ctx: Context, argument) -> IntSequence:
+        return await self.conversion(ctx, argument)
+
+    async def transform(self, interaction: Interaction, value: str) -> IntSequence:
+        return await self.conversion(interaction, value)
+
+
+_INT_LIST_TOKEN = re.compile(r"[\s,]*(?:(-?\d+)(?:(?:-|\.\.)(-?\d+))?(?![^\s,])|([^\s,]+))")
+
+
+def _permission_table() -> dict[str, int]:
+    table = {
+        name: value.flag for name, value in inspect.getmembers(discord.Permissions, lambda v: isinstance(v, flag_value))
+    }
+    table.update(admin=table["administrator"], all=discord.Permissions.all().value)
+    return table
+
+
+# Permission name (lowercase, words joined by underscores, "server" spelled "guild") to bit value
+PERMISSION_BITS = _permission_table()
+ALL_PERMISSIONS = discord.Permissions.all().value
+_PERMISSION_WORDS = max(name.count("_") + 1 for name in PERMISSION_BITS)
+
+
+def parse_permission_bits(argument: str) -> Tuple[int, int]:
+    """
+    Parses a string of permission names into the bits to allow and the bits to deny, in one pass.
+
+    Names are case-insensitive and may be written with underscores, hyphens or spaces, ``server`` may be
+    used in place of ``guild``, ``admin`` for ``administrator``, and ``all`` for every permission.
+    Prefixing a name with ``-`` denies it instead. A plain number is taken as a permission value.
+
+    Examples: ``"kick members, ban-members"``, ``"all -administrator"``, ``"Manage Server"``, ``"8"``
+
+    Raises
+    ------
+    InvalidPermission
+        A word isn't a permission name
+    """
+    if argument.isdigit() and not int(argument) & ~ALL_PERMISSIONS:
+        return int(argument), 0
+    words = re.split(r"[\s,_]+|(?<=\w)-", argument.lower().replace("server", "guild"))
+    words = [word for word in words if word]
+    allow = deny = 0
+    i = 0
+    while i < len(words):
+        negate = words[i].startswith("-")
+        first = words[i].lstrip("-")
+        for n in range(min(_PERMISSION_WORDS, len(words) - i), 0, -1):
+            bit = PERMISSION_BITS.get("_".join((first, *words[i + 1 : i + n])))  # noqa: E203
+            if bit is not None:
+                break
+        else:
+            raise InvalidPermission(words[i])
+        if negate:
+            deny |= bit
+        else:
+            allow |= bit
+        i += n
+    return allow, deny
+
+
+def parse_permissions(arguments: Iterable[str]) -> List[discord.Permissions]:
+    """
+    Parses many permission strings at once (see :func:`parse_permission_bits`), with denied permissions removed.
+    Repeated strings are only parsed once.
+    """
+    parsed: dict[str, int] = {}
+    result = []
+    for argument in arguments:
+        value = parsed.get(argument)
+        if value is None:
+            allow, deny = parse_permission_bits(argument)
+            value = parsed[argument] = allow & ~deny
+        result.append(discord.Permissions(value))
+    return result
+
+
+def parse_overwrites(arguments: Iterable[str]) -> List[discord.PermissionOverwrite]:
+    """
+    Parses many permission strings at once into overwrites, where ``-name`` denies a permission
+    and names not mentioned are left unset. Repeated strings are only parsed once.
+    """
+    parsed: dict[str, Tuple[int, int]] = {}
+    result = []
+    for argument in arguments:
+        pair = parsed.get(argument)
+        if pair is None:
+            pair = parsed[argument] = parse_permission_bits(argument)
+        result.append(discord.PermissionOverwrite.from_pair(discord.Permissions(pair[0]), discord.Permissions(pair[1])))
+    return result
 
 
 class Permissions(commands.Converter, discord.Permissions):
     """
     A converter to convert a string of permissions to a discord.Permissions object.
+    See :func:`parse_permission_bits` for the accepted format.
     """
 
     @classmethod
+    @instrumented
     async def convert(cls, ctx: Context, argument) -> discord.Permissions:
-        if argument.isdigit() and int(argument) < discord.Permissions.all().value:
-            return discord.Permissions(int(argument))
-        perms = argument.replace("server", "guild").lower().split()
-        perm = discord.Permissions()
-        for p in perms:
-            try:
-                setattr(perm, p, True)
-            except Exception as e:
-                raise InvalidPermission(p) from e
-        return perm
+        note(path="parse")
+        allow, deny = parse_permission_bits(argument)
+        return discord.Permissions(allow & ~deny)
 
 
 if opts := getattr(app_commands.transformers, "CHANNEL_TO_TYPES", {}):
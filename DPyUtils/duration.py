@@ -1,12 +1,16 @@
 import datetime
 import re
 from collections import namedtuple
-from typing import Union
+from fractions import Fraction
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence, Union
 
 from discord.app_commands import Transformer
 from discord.ext.commands import BadArgument, Context, Converter
 
-from .utils import _and, s
+from .utils import _and, _numpy, s
+
+if TYPE_CHECKING:
+    import numpy as np
 
 ParsedDuration = namedtuple(
     "ParsedDuration",
@@ -25,6 +29,26 @@ durations = {
     "s": 1,  # 60/60
 }
 
+# Every accepted spelling of a unit, to its length in seconds
+UNITS: Dict[str, Union[int, Fraction]] = {
+    **dict.fromkeys(("y", "yr", "yrs", "year", "years"), durations["y"]),
+    **dict.fromkeys(("mo", "mos", "month", "months"), durations["y"] // 12),
+    **dict.fromkeys(("w", "wk", "wks", "week", "weeks"), durations["w"]),
+    **dict.fromkeys(("d", "day", "days"), durations["d"]),
+    **dict.fromkeys(("h", "hr", "hrs", "hour", "hours"), durations["h"]),
+    **dict.fromkeys(("m", "min", "mins", "minute", "minutes"), durations["m"]),
+    **dict.fromkeys(("s", "sec", "secs", "second", "seconds"), durations["s"]),
+    **dict.fromkeys(("ms", "msec", "msecs", "millisecond", "milliseconds"), Fraction(1, 1000)),
+}
+
+_UNIT_MILLISECONDS = {unit: int(size * 1000) for unit, size in UNITS.items()}
+# Splits "1h 30min" into ["1", "h", "30", "min", ""]: amounts at even positions, units at odd ones
+_UNIT_SPLIT = re.compile(r"\s*([a-z]+)[\s,]*")
+# Splits "1h 30min" into ["", "1", "h", "", "30", "min", ""]: a string of whole amounts and units
+# leaves only empty strings between the parts
+_WHOLE_SPLIT = re.compile(r"([0-9]+)\s*([a-z]+)[\s,]*")
+_AMOUNT_START = frozenset("0123456789.")
+
 
 class InvalidTimeFormat(BadArgument):
     def __init__(self, argument):
@@ -32,11 +56,79 @@ class InvalidTimeFormat(BadArgument):
         super().__init__("'{}' is an invalid format for time! Format must be '1y1w1d1h1m1s'.".format(argument))
 
 
+def to_seconds(argument: str) -> int:
+    """
+    Parses a duration string into whole seconds.
+
+    The string is a sequence of amounts with units, like '1y1w1d1h1m1s' or '2 days, 4hr 30 min', in any order.
+    Amounts may have decimals ('1.5h'), units are any of the spellings in :data:`UNITS` (ignoring case),
+    and a bare integer is taken as seconds. The total is computed exactly and rounded to the nearest second once.
+
+    Raises
+    ------
+    InvalidTimeFormat
+        Any part of the string isn't an amount followed by a known unit
+    """
+    try:
+        # Bare (also signed or padded) integers, the most common argument, cost a single int() call
+        return int(argument)
+    except ValueError:
+        pass
+    text = argument.strip().lower()
+    try:
+        if text[:1] not in _AMOUNT_START:
+            raise ValueError(text)
+        if "." not in text:
+            # Whole amounts, the common case: one regex pass, and nothing may be left between the matches
+            parts = _WHOLE_SPLIT.split(text)
+            if parts.count("") * 3 == len(parts) + 2:
+                if len(parts) == 4:
+                    total = int(parts[1]) * _UNIT_MILLISECONDS[parts[2]]
+                else:
+                    total = 0
+                    for amount, unit in zip(parts[1::3], parts[2::3]):
+                        total += int(amount) * _UNIT_MILLISECONDS[unit]
+                return total // 1000 if not total % 1000 else _round(total, 1000)
+        # Decimals, or invalid; every character is accounted for by the checks in _to_seconds_decimal
+        parts = _UNIT_SPLIT.split(text)
+        if parts[-1] or len(parts) < 3:
+            raise ValueError(text)
+        return _to_seconds_decimal(parts)
+    except (KeyError, ValueError):
+        raise InvalidTimeFormat(argument) from None
+
+
+def _to_seconds_decimal(parts: List[str]) -> int:
+    # Summed as an integer count of 1 / (1000 * 10 ** places) seconds, so decimals never lose precision
+    total = 0
+    places = 0
+    pairs = iter(parts)
+    for amount, unit in zip(pairs, pairs):
+        whole, _, decimals = amount.partition(".")
+        digits = whole + decimals
+        if not (digits.isascii() and digits.isdigit()):
+            raise ValueError(amount)
+        if len(decimals) > places:
+            total *= 10 ** (len(decimals) - places)
+            places = len(decimals)
+        total += int(digits) * _UNIT_MILLISECONDS[unit] * 10 ** (places - len(decimals))
+    return _round(total, 1000 * 10**places)
+
+
+def _round(numerator: int, denominator: int) -> int:
+    """
+    Rounds ``numerator / denominator`` to the nearest integer, half to even like :func:`round`.
+    """
+    quotient, rest = divmod(numerator, denominator)
+    return quotient + (2 * rest > denominator or (2 * rest == denominator and quotient % 2))
+
+
 class Duration(Converter, Transformer):
     """
     A converter to convert a string to a Duration object.
     The string must be in the format of '1y1w1d1h1m1s' where the numbers are the amount of years, weeks, days, hours, minutes and seconds respectively.
-    The letters are the short forms of the time units.
+    The letters are the short forms of the time units; longer ones like 'min', 'hr', 'mo' (months) and 'ms' work too,
+    and the parts may be separated by spaces or commas. See :func:`to_seconds` for the details.
     The order of the time units does not matter.
     """
 
@@ -99,17 +191,7 @@ class Duration(Converter, Transformer):
         ctx: Context | None
             The context of the command (unused)
         """
-        try:
-            return cls(argument, int(argument))
-        except ValueError:
-            pass
-        seconds = 0
-        match = re.findall(r"([0-9]+?(?:\.[0-9]+)?[ywdhms])", argument)
-        if not match:
-            raise InvalidTimeFormat(argument)
-        for item in match:
-            seconds += float(item[:-1]) * durations[item[-1]]
-        return cls(argument, round(seconds))
+        return cls(argument, to_seconds(argument))
 
     # TODO: implement humanize in this
 
@@ -159,7 +241,14 @@ def strfdur(
         Use the first letter of the time unit instead of the full word.
     """
     dur: ParsedDuration = parse(param) if not isinstance(param, ParsedDuration) else param
-    dict_times = {incr: getattr(dur, incr + "s") for incr in ["year", "week", "day", "hour", "minute", "second"]}
+    return _strfdur(dur[:6], compact, letter)
+
+
+def _strfdur(values: Sequence[int], compact: bool, letter: bool) -> str:
+    """
+    Formats the amounts of years, weeks, days, hours, minutes and seconds of a duration, see :func:`strfdur`.
+    """
+    dict_times = dict(zip(("year", "week", "day", "hour", "minute", "second"), values))
     times = [(k, int(v)) for k, v in dict_times.items() if v or (k not in ("year", "week") and compact)] or [
         ("second", 0)
     ]
@@ -190,3 +279,78 @@ def strfdur(
     #    else:
     #        fmt = " and ".join(_fmt(*t) for t in times)
     return fmt
+
+
+def parse_many(strings: Iterable[str], *, default: int | None = None) -> "np.ndarray":
+    """
+    Parses many duration strings at once into an ``int64`` array of seconds, exactly like :func:`to_seconds`
+    (and so :meth:`Duration.convert`). Needs NumPy. Each distinct string is only parsed once, so columns
+    with repeated values like '1h' or '7d' cost little more than their distinct values.
+
+    Parameters
+    ----------
+    strings: Iterable[str]
+        The durations to parse
+    default: int | None
+        The seconds to use for invalid strings, instead of raising
+
+    Raises
+    ------
+    InvalidTimeFormat
+        One of the strings isn't a duration, and no ``default`` was given
+    OverflowError
+        A duration doesn't fit in an ``int64``
+    """
+    np = _numpy("parse_many")
+    parsed: Dict[str, int] = {}
+
+    def seconds(argument: str) -> int:
+        value = parsed.get(argument)
+        if value is None:
+            try:
+                value = to_seconds(argument)
+            except InvalidTimeFormat:
+                if default is None:
+                    raise
+                value = default
+            parsed[argument] = value
+        return value
+
+    return np.fromiter(map(seconds, strings), np.int64)
+
+
+def strfdur_many(seconds: "Iterable[int] | np.ndarray", *, compact: bool = False, letter: bool = False) -> List[str]:
+    """
+    Formats many durations at once, giving exactly what :func:`strfdur` gives for each. Needs NumPy.
+
+    The breakdown into years, weeks, days, hours, minutes and seconds is done with one :func:`numpy.divmod`
+    per unit in :data:`durations` over the whole array, and each distinct duration is only formatted once.
+
+    Parameters
+    ----------
+    seconds: Iterable[int] | numpy.ndarray
+        The durations in seconds, fractions are truncated like :func:`strfdur` does
+    compact: bool
+        Change the format to 0:00:00:00 (d:hh:mm:ss) if True. Cannot be used with times greater than 7 days.
+    letter: bool
+        Use the first letter of the time unit instead of the full word.
+
+    Examples
+    --------
+    .. code-block:: python3
+
+        rows = await db.fetch("SELECT user_id, duration FROM mutes")
+        for row, text in zip(rows, strfdur_many([row["duration"] for row in rows])):
+            ...
+    """
+    np = _numpy("strfdur_many")
+    values, inverse = np.unique(np.asarray(seconds, dtype=np.int64).ravel(), return_inverse=True)
+    columns = []
+    rest = values
+    for size in durations.values():
+        amount, rest = np.divmod(rest, size)
+        columns.append(amount.tolist())
+    if compact and (any(columns[0]) or any(columns[1])):
+        raise TypeError("Compact cannot be used with times greater than 7 days")
+    formatted = [_strfdur(row, compact, letter) for row in zip(*columns)]
+    return [formatted[i] for i in inverse.tolist()]
@@ -0,0 +1,865 @@
+import functools
+import heapq
+import time
+import weakref
+from bisect import bisect_left, insort
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+import discord
+from discord.ext.commands import Bot
+
+
+class NameIndex:
+    """
+    An incrementally maintained index over the string attributes of a set of objects.
+
+    Lookups yield the same match tiers that :func:`converters.search` uses:
+    exact, prefix, case-insensitive prefix, substring and case-insensitive substring.
+    The prefix tiers are answered from sorted key lists, the substring tiers scan the
+    distinct (pre-casefolded) names instead of every object.
+
+    Parameters
+    ----------
+    attrs : str
+        The attributes to index on each object
+    weak : bool
+        Only hold weak references to the objects, so the index doesn't keep them alive
+    """
+
+    def __init__(self, *attrs: str, weak: bool = False):
+        self.attrs = attrs
+        self.weak = weak
+        self.complete: bool = False
+        self._objects: Dict[int, Any] = {}
+        self._keys: Dict[int, Tuple[str, ...]] = {}
+        self._exact: Dict[str, Dict[int, None]] = {}
+        self._folded: Dict[str, Dict[int, None]] = {}
+        self._sorted: List[str] = []
+        self._sorted_folded: List[str] = []
+        # (id, reference) of weakly held objects that were garbage collected, see purge()
+        self._dead: List[Tuple[int, weakref.ref]] = []
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __iter__(self):
+        if not self.weak:
+            return iter(self._objects.values())
+        return (obj for ref in tuple(self._objects.values()) if (obj := ref()) is not None)
+
+    def __contains__(self, obj_id: int):
+        return obj_id in self._objects
+
+    def ids(self):
+        return self._objects.keys()
+
+    def get(self, obj_id: int):
+        obj = self._objects.get(obj_id)
+        if self.weak and obj is not None:
+            return obj()
+        return obj
+
+    def _ref(self, obj) -> weakref.ref:
+        # The callback only queues the ID: it can run during any allocation, even halfway through a lookup
+        return weakref.ref(obj, lambda ref, obj_id=obj.id, dead=self._dead: dead.append((obj_id, ref)))
+
+    def purge(self):
+        """
+        Removes the weakly held objects that have been garbage collected since the last purge.
+        """
+        dead = self._dead
+        while dead:
+            obj_id, ref = dead.pop()
+            if self._objects.get(obj_id) is ref:
+                self.remove(obj_id)
+
+    def _keys_of(self, obj) -> Tuple[str, ...]:
+        keys = []
+        for attr in self.attrs:
+            value = getattr(obj, attr, None)
+            if value and value not in keys:
+                keys.append(value)
+        return tuple(keys)
+
+    @staticmethod
+    def _link(table: Dict[str, Dict[int, None]], ordered: List[str], key: str, obj_id: int):
+        bucket = table.get(key)
+        if bucket is None:
+            bucket = table[key] = {}
+            insort(ordered, key)
+        bucket[obj_id] = None
+
+    @staticmethod
+    def _unlink(table: Dict[str, Dict[int, None]], ordered: List[str], key: str, obj_id: int):
+        bucket = table.get(key)
+        if bucket is None:
+            return
+        bucket.pop(obj_id, None)
+        if not bucket:
+            del table[key]
+            i = bisect_left(ordered, key)
+            if i < len(ordered) and ordered[i] == key:
+                del ordered[i]
+
+    def add(self, obj):
+        """
+        Adds an object to the index, replacing any entry with the same ID.
+        """
+        if obj.id in self._objects:
+            self.remove(obj.id)
+        keys = self._keys_of(obj)
+        self._objects[obj.id] = self._ref(obj) if self.weak else obj
+        self._keys[obj.id] = keys
+        for key in keys:
+            self._link(self._exact, self._sorted, key, obj.id)
+            self._link(self._folded, self._sorted_folded, key.casefold(), obj.id)
+
+    def extend(self, objs: Iterable[Any]):
+        """
+        Adds many objects at once, sorting the key lists once at the end instead of inserting every key
+        into them, so building an index from scratch takes O(n log n) rather than quadratic time.
+        """
+        exact, folded = self._exact, self._folded
+        new_exact, new_folded = [], []
+        for obj in objs:
+            if obj.id in self._objects:
+                self.remove(obj.id)
+            keys = self._keys_of(obj)
+            self._objects[obj.id] = self._ref(obj) if self.weak else obj
+            self._keys[obj.id] = keys
+            for key in keys:
+                if (bucket := exact.get(key)) is None:
+                    bucket = exact[key] = {}
+                    new_exact.append(key)
+                bucket[obj.id] = None
+                if (bucket := folded.get(key := key.casefold())) is None:
+                    bucket = folded[key] = {}
+                    new_folded.append(key)
+                bucket[obj.id] = None
+        # The old lists are already sorted, so sorting them with the sorted new keys appended is a single merge
+        if new_exact:
+            new_exact.sort()
+            self._sorted = sorted(self._sorted + new_exact)
+        if new_folded:
+            new_folded.sort()
+            self._sorted_folded = sorted(self._sorted_folded + new_folded)
+
+    def remove(self, obj_id: int):
+        """
+        Removes an object from the index by ID. Does nothing if it isn't indexed.
+        """
+        self._objects.pop(obj_id, None)
+        for key in self._keys.pop(obj_id, ()):
+            self._unlink(self._exact, self._sorted, key, obj_id)
+            self._unlink(self._folded, self._sorted_folded, key.casefold(), obj_id)
+
+    def update(self, obj):
+        """
+        Re-indexes an object whose indexed attributes may have changed.
+        """
+        if self._keys.get(obj.id) == self._keys_of(obj):
+            self._objects[obj.id] = self._ref(obj) if self.weak else obj
+        else:
+            self.add(obj)
+
+    def refresh(self, obj_id: int):
+        """
+        Re-indexes an already indexed object in place, e.g. after its user was updated.
+        """
+        obj = self.get(obj_id)
+        if obj is not None:
+            self.update(obj)
+
+    def _resolve(self, buckets: Iterable[Dict[int, None]]) -> list:
+        ids: Dict[int, None] = {}
+        for bucket in buckets:
+            ids.update(bucket)
+        get = self.get
+        return [obj for i in ids if (obj := get(i)) is not None]
+
+    @staticmethod
+    def _prefixed(table: Dict[str, Dict[int, None]], ordered: List[str], prefix: str) -> Iterator[Dict[int, None]]:
+        i = bisect_left(ordered, prefix)
+        while i < len(ordered) and ordered[i].startswith(prefix):
+            yield table[ordered[i]]
+            i += 1
+
+    def tiers(self, argument: str) -> Iterator[list]:
+        """
+        Lazily yields the objects matching each search tier, most exact first.
+
+        Parameters
+        ----------
+        argument : str
+            The search term
+        """
+        folded = argument.casefold()
+        yield self._resolve([self._exact.get(argument, {})])
+        yield self._resolve(self._prefixed(self._exact, self._sorted, argument))
+        yield self._resolve(self._prefixed(self._folded, self._sorted_folded, folded))
+        yield self._resolve(bucket for key, bucket in self._exact.items() if argument in key)
+        yield self._resolve(bucket for key, bucket in self._folded.items() if folded in key)
+
+    def suggest(
+        self, argument: str, limit: int = 25, keep: Callable[[Any], bool] | None = None, deadline: float | None = None
+    ) -> list:
+        """
+        Returns up to ``limit`` objects matching ``argument`` in tier order (exact, prefix,
+        case-insensitive prefix, case-insensitive substring), without resolving whole tiers.
+
+        Parameters
+        ----------
+        argument : str
+            What has been typed so far, an empty string matches everything
+        limit : int
+            The maximum amount of objects to return
+        keep : Callable[[Any], bool]
+            Only return objects this returns True for
+        deadline : float
+            A :func:`time.perf_counter` value after which to stop and return what was found so far
+        """
+        folded = argument.casefold()
+        buckets = chain(
+            [self._exact.get(argument, {})],
+            self._prefixed(self._exact, self._sorted, argument),
+            self._prefixed(self._folded, self._sorted_folded, folded),
+            (bucket for key, bucket in self._folded.items() if folded in key),
+        )
+        found: Dict[int, Any] = {}
+        get = self.get
+        for n, bucket in enumerate(buckets):
+            for obj_id in bucket:
+                if obj_id not in found and (obj := get(obj_id)) is not None and (keep is None or keep(obj)):
+                    found[obj_id] = obj
+                    if len(found) >= limit:
+                        return list(found.values())
+            if deadline is not None and not n % 64 and time.perf_counter() > deadline:
+                break
+        return list(found.values())
+
+    def closest(self, argument: str, limit: int, cutoff: float, keep: Callable[[Any], bool] | None = None) -> list:
+        """
+        Returns up to ``limit`` objects whose casefolded names are closest to the argument. See :func:`closest`.
+        """
+        return closest(argument, self.keyed(), limit, cutoff, keep)
+
+    def keyed(self) -> Iterator[Tuple[str, list]]:
+        """
+        Yields each distinct casefolded name with the objects that have it.
+        """
+        get = self.get
+        for key, bucket in self._folded.items():
+            yield key, [obj for i in bucket if (obj := get(i)) is not None]
+
+
+class IndexUnion:
+    """
+    Several :class:`NameIndex` es searched as one, e.g. the bot and human partitions of a :class:`UserIndex`.
+    """
+
+    def __init__(self, *indexes: NameIndex):
+        self.indexes = indexes
+
+    def __len__(self):
+        return sum(len(index) for index in self.indexes)
+
+    def __iter__(self):
+        for index in self.indexes:
+            yield from index
+
+    def tiers(self, argument: str) -> Iterator[list]:
+        for tier in zip(*(index.tiers(argument) for index in self.indexes)):
+            yield [obj for objs in tier for obj in objs]
+
+    def closest(self, argument: str, limit: int, cutoff: float, keep: Callable[[Any], bool] | None = None) -> list:
+        keyed = (pair for index in self.indexes for pair in index.keyed())
+        return closest(argument, keyed, limit, cutoff, keep)
+
+
+def _distance(a: str, b: str, limit: int) -> int:
+    """
+    Levenshtein distance between two strings, giving up with ``limit + 1`` as soon as it must exceed ``limit``.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if len(a) > len(b):
+        a, b = b, a
+    previous = list(range(len(a) + 1))
+    for i, char_b in enumerate(b, 1):
+        current = [i]
+        for j, char_a in enumerate(a, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def closest(
+    argument: str,
+    keyed: Iterable[Tuple[str, Iterable[Any]]],
+    limit: int,
+    cutoff: float,
+    keep: Callable[[Any], bool] | None = None,
+) -> list:
+    """
+    Finds the objects whose names are most similar to the argument, for "did you mean" suggestions.
+
+    Similarity is ``1 - distance / max(len(a), len(b))`` over casefolded names, and only names at or above
+    ``cutoff`` are kept. Only the best ``limit`` names are held in a heap, and once it's full the allowed
+    distance shrinks to beat the worst of them, so most names are rejected on length alone or abandoned
+    after a few rows of the distance table.
+
+    Parameters
+    ----------
+    argument : str
+        The search term
+    keyed : Iterable[Tuple[str, Iterable]]
+        Pairs of a casefolded name and the objects with that name
+    limit : int
+        The maximum amount of objects to return
+    cutoff : float
+        The minimum similarity, from 0 to 1
+    keep : Callable
+        A predicate the objects must pass, if any
+    """
+    folded = argument.casefold()
+    heap: List[Tuple[int, int, list]] = []  # (-distance, tiebreaker, objects), worst on top
+    for n, (key, objs) in enumerate(keyed):
+        if keep is not None:
+            objs = [obj for obj in objs if keep(obj)]
+        if not objs:
+            continue
+        bound = int((1 - cutoff) * max(len(key), len(folded)))
+        if len(heap) >= limit:
+            bound = min(bound, -heap[0][0] - 1)
+        dist = _distance(folded, key, bound)
+        if dist > bound:
+            continue
+        heapq.heappush(heap, (-dist, -n, objs))
+        if len(heap) > limit:
+            heapq.heappop(heap)
+        if len(heap) >= limit and -heap[0][0] <= 1:
+            break  # nothing short of an exact match, which the search tiers already ruled out, can beat these
+    result = {}
+    for _, _, objs in sorted(heap, reverse=True):
+        for obj in objs:
+            result.setdefault(id(obj), obj)
+    return list(result.values())[:limit]
+
+
+class PrefixTrie:
+    """
+    A prefix tree over a fixed set of strings where every node keeps its first ``limit`` completions,
+    so completing a prefix costs one dictionary step per character no matter how many strings there are.
+
+    Parameters
+    ----------
+    words : Iterable[str]
+        The strings to complete, completions keep this order
+    limit : int
+        The maximum amount of completions to keep per prefix
+    """
+
+    __slots__ = ("limit", "_root")
+
+    def __init__(self, words: Iterable[str] = (), limit: int = 25):
+        self.limit = limit
+        # Each node is [children, completions]
+        self._root: list = [{}, []]
+        for word in words:
+            self.add(word)
+
+    def add(self, word: str):
+        node = self._root
+        if len(node[1]) < self.limit:
+            node[1].append(word)
+        for char in word.casefold():
+            node = node[0].setdefault(char, [{}, []])
+            if len(node[1]) < self.limit:
+                node[1].append(word)
+
+    def complete(self, prefix: str) -> List[str]:
+        """
+        Returns up to ``limit`` strings starting with ``prefix``, ignoring case.
+        """
+        node = self._root
+        for char in prefix.casefold():
+            node = node[0].get(char)
+            if node is None:
+                return []
+        return list(node[1])
+
+
+class MemberIndex:
+    """
+    Keeps one :class:`NameIndex` over ``name`` and ``display_name`` per guild, updated from member events.
+
+    Guild indexes are built lazily from the member cache the first time they're used,
+    and rebuilt once if the guild finishes chunking after that. Members that enter or leave the cache without
+    an event (gateway queries, message authors, voice and presence updates) are picked up on the next lookup,
+    which reconciles the index with the cache whenever their sizes differ.
+    """
+
+    events = (
+        "on_member_join",
+        "on_member_update",
+        "on_raw_member_remove",
+        "on_user_update",
+        "on_guild_remove",
+    )
+
+    def __init__(self):
+        self._guilds: Dict[int, NameIndex] = {}
+
+    def install(self, bot: Bot):
+        for event in self.events:
+            bot.add_listener(getattr(self, event), event)
+
+    def get(self, guild: discord.Guild) -> NameIndex:
+        """
+        Returns the name index for a guild, building it if needed.
+        """
+        index = self._guilds.get(guild.id)
+        if index is None or (not index.complete and guild.chunked):
+            index = NameIndex("name", "display_name")
+            index.extend(guild.members)
+            index.complete = guild.chunked
+            self._guilds[guild.id] = index
+        elif len(index) != len(guild._members):
+            self.sync(guild, index)
+        return index
+
+    @staticmethod
+    def sync(guild: discord.Guild, index: NameIndex):
+        """
+        Reconciles a guild's index with its member cache.
+        """
+        members = guild._members
+        for member_id in [i for i in index.ids() if i not in members]:
+            index.remove(member_id)
+        index.extend([member for member_id, member in members.items() if member_id not in index])
+
+    async def on_member_join(self, member: discord.Member):
+        if (index := self._guilds.get(member.guild.id)) is not None:
+            index.add(member)
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if (index := self._guilds.get(after.guild.id)) is not None:
+            index.update(after)
+
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        if (index := self._guilds.get(payload.guild_id)) is not None:
+            index.remove(payload.user.id)
+
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        for index in self._guilds.values():
+            index.refresh(after.id)
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._guilds.pop(guild.id, None)
+
+
+def get_member_index(bot: Bot) -> MemberIndex:
+    """
+    Returns the bot's :class:`MemberIndex`, creating it and registering its listeners on first use.
+    """
+    index = getattr(bot, "converters_member_index", None)
+    if index is None:
+        index = bot.converters_member_index = MemberIndex()
+        index.install(bot)
+    return index
+
+
+class RoleIndex:
+    """
+    Keeps one :class:`NameIndex` over role names per guild, updated from role events.
+    """
+
+    events = (
+        "on_guild_role_create",
+        "on_guild_role_update",
+        "on_guild_role_delete",
+        "on_guild_remove",
+    )
+
+    def __init__(self):
+        self._guilds: Dict[int, NameIndex] = {}
+
+    def install(self, bot: Bot):
+        for event in self.events:
+            bot.add_listener(getattr(self, event), event)
+
+    def get(self, guild: discord.Guild) -> NameIndex:
+        """
+        Returns the name index for a guild, building it if needed.
+        """
+        index = self._guilds.get(guild.id)
+        if index is None:
+            index = self._guilds[guild.id] = NameIndex("name")
+            index.extend(guild.roles)
+            index.complete = True
+        return index
+
+    async def on_guild_role_create(self, role: discord.Role):
+        if (index := self._guilds.get(role.guild.id)) is not None:
+            index.add(role)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        if (index := self._guilds.get(after.guild.id)) is not None:
+            index.update(after)
+
+    async def on_guild_role_delete(self, role: discord.Role):
+        if (index := self._guilds.get(role.guild.id)) is not None:
+            index.remove(role.id)
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._guilds.pop(guild.id, None)
+
+
+def get_role_index(bot: Bot) -> RoleIndex:
+    """
+    Returns the bot's :class:`RoleIndex`, creating it and registering its listeners on first use.
+    """
+    index = getattr(bot, "converters_role_index", None)
+    if index is None:
+        index = bot.converters_role_index = RoleIndex()
+        index.install(bot)
+    return index
+
+
+class UserIndex:
+    """
+    A bot-wide :class:`NameIndex` over user names, partitioned into bots and humans.
+
+    It only holds weak references, like the client's own user cache, and users that are garbage collected
+    are dropped on the next lookup. Users entering the cache are added as discord.py stores them and name
+    changes come in through ``on_user_update``. If the cache was replaced (e.g. cleared on reconnect) the
+    index is reconciled with it on lookup, at most once every ``sync_interval`` seconds.
+    """
+
+    events = ("on_user_update", "on_member_join", "on_raw_member_remove", "on_guild_remove")
+
+    def __init__(self, bot: Bot, sync_interval: float = 5.0):
+        self._state = bot._connection
+        self.bots = NameIndex("name", weak=True)
+        self.humans = NameIndex("name", weak=True)
+        self.everyone = IndexUnion(self.humans, self.bots)
+        self.sync_interval = sync_interval
+        self._synced_at = 0.0
+
+    def install(self, bot: Bot):
+        for event in self.events:
+            bot.add_listener(getattr(self, event), event)
+        state = bot._connection
+        store_user = state.store_user
+
+        @functools.wraps(store_user)
+        def store(data, *, cache: bool = True) -> discord.User:
+            user = store_user(data, cache=cache)
+            if cache and user.id not in self._partition(user):
+                self.add(user)
+            return user
+
+        # discord.py adds every user to its cache through this, so new users never need to be looked for
+        state.store_user = store
+
+    def _partition(self, user: discord.abc.User) -> NameIndex:
+        return self.bots if user.bot else self.humans
+
+    def add(self, user: discord.abc.User):
+        self._partition(user).add(user)
+
+    def sync(self):
+        """
+        Reconciles the index with the client's user cache.
+        """
+        users = self._state._users
+        for index in (self.bots, self.humans):
+            index.purge()
+            for user_id in [i for i in index.ids() if i not in users]:
+                index.remove(user_id)
+        missing = [user for user_id, user in users.items() if user_id not in self.bots and user_id not in self.humans]
+        self.bots.extend(user for user in missing if user.bot)
+        self.humans.extend(user for user in missing if not user.bot)
+        self._synced_at = time.monotonic()
+
+    def get(self, mem_type: str = "EITHER") -> NameIndex | IndexUnion:
+        """
+        Returns the index to search for the given member type, syncing it first if it's out of date.
+        """
+        self.bots.purge()
+        self.humans.purge()
+        if len(self.everyone) != len(self._state._users) and time.monotonic() - self._synced_at >= self.sync_interval:
+            self.sync()
+        if mem_type == "BOT":
+            return self.bots
+        if mem_type == "HUMAN":
+            return self.humans
+        return self.everyone
+
+    def _drop_uncached(self, user_ids: Iterable[int]):
+        users = self._state._users
+        for user_id in user_ids:
+            if user_id not in users:
+                self.bots.remove(user_id)
+                self.humans.remove(user_id)
+
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        self._partition(after).update(after)
+
+    async def on_member_join(self, member: discord.Member):
+        if member.id not in self._partition(member):
+            self.add(member._user)
+
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        self._drop_uncached((payload.user.id,))
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._drop_uncached([member.id for member in guild.members])
+
+
+def get_user_index(bot: Bot) -> UserIndex:
+    """
+    Returns the bot's :class:`UserIndex`, creating it and registering its listeners on first use.
+    """
+    index = getattr(bot, "converters_user_index", None)
+    if index is None:
+        index = bot.converters_user_index = UserIndex(bot)
+        index.sync()
+        index.install(bot)
+    return index
+
+
+class ChannelDirectory:
+    """
+    Pre-sorted, type-partitioned channel lists per guild and across all guilds.
+
+    discord.py rebuilds and sorts lists like ``guild.text_channels`` on every access; this keeps each list
+    (as a tuple) until a channel or thread event for that guild invalidates it, and rebuilds it on next use.
+
+    The attributes are the :class:`discord.Guild` list properties:
+    ``categories``, ``text_channels``, ``voice_channels``, ``stage_channels``, ``forums`` and ``threads``.
+    """
+
+    events = (
+        "on_guild_channel_create",
+        "on_guild_channel_update",
+        "on_guild_channel_delete",
+        "on_thread_create",
+        "on_thread_join",
+        "on_raw_thread_update",
+        "on_thread_remove",
+        "on_raw_thread_delete",
+        "on_guild_join",
+        "on_guild_available",
+        "on_guild_remove",
+        "on_guild_unavailable",
+    )
+
+    def __init__(self, bot: Bot):
+        self._bot = bot
+        self._guilds: Dict[int, Dict[Tuple[str, ...], tuple]] = {}
+        self._all: Dict[Tuple[str, ...], tuple] = {}
+        self._indexes: Dict[int, Dict[Tuple[str, ...], NameIndex]] = {}
+
+    def install(self, bot: Bot):
+        for event in self.events:
+            bot.add_listener(getattr(self, event), event)
+
+    def get(self, guild: discord.Guild, *attributes: str) -> tuple:
+        """
+        Returns one of a guild's channel lists, in the same order discord.py sorts it.
+        Passing several attributes returns those lists joined together, which is cached as well.
+        """
+        lists = self._guilds.setdefault(guild.id, {})
+        channels = lists.get(attributes)
+        if channels is None:
+            if len(attributes) == 1:
+                channels = tuple(getattr(guild, attributes[0]))
+            else:
+                channels = tuple(channel for attribute in attributes for channel in self.get(guild, attribute))
+            lists[attributes] = channels
+        return channels
+
+    def index(self, guild: discord.Guild, *attributes: str) -> NameIndex:
+        """
+        Returns a :class:`NameIndex` over the names of one (or several joined) of a guild's channel lists,
+        built on first use and dropped along with the lists.
+        """
+        indexes = self._indexes.setdefault(guild.id, {})
+        index = indexes.get(attributes)
+        if index is None:
+            index = indexes[attributes] = NameIndex("name")
+            index.extend(self.get(guild, *attributes))
+            index.complete = True
+        return index
+
+    def all(self, *attributes: str) -> tuple:
+        """
+        Returns one (or several joined) of the channel lists across every guild the bot is in.
+        """
+        channels = self._all.get(attributes)
+        if channels is None:
+            channels = self._all[attributes] = tuple(
+                channel for guild in self._bot.guilds for channel in self.get(guild, *attributes)
+            )
+        return channels
+
+    def invalidate(self, guild_id: int):
+        self._guilds.pop(guild_id, None)
+        self._indexes.pop(guild_id, None)
+        self._all.clear()
+
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        self.invalidate(channel.guild.id)
+
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        self.invalidate(after.guild.id)
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.invalidate(channel.guild.id)
+
+    async def on_thread_create(self, thread: discord.Thread):
+        self.invalidate(thread.guild.id)
+
+    async def on_thread_join(self, thread: discord.Thread):
+        # Sent instead of thread_create when an uncached thread becomes visible, e.g. it was unarchived
+        self.invalidate(thread.guild.id)
+
+    async def on_raw_thread_update(self, payload: discord.RawThreadUpdateEvent):
+        # Unlike on_thread_update, this also fires for threads that weren't cached
+        self.invalidate(payload.guild_id)
+
+    async def on_thread_remove(self, thread: discord.Thread):
+        self.invalidate(thread.guild.id)
+
+    async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent):
+        self.invalidate(payload.guild_id)
+
+    async def on_guild_join(self, guild: discord.Guild):
+        self.invalidate(guild.id)
+
+    async def on_guild_available(self, guild: discord.Guild):
+        self.invalidate(guild.id)
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.invalidate(guild.id)
+
+    async def on_guild_unavailable(self, guild: discord.Guild):
+        self.invalidate(guild.id)
+
+
+def get_channel_directory(bot: Bot) -> ChannelDirectory:
+    """
+    Returns the bot's :class:`ChannelDirectory`, creating it and registering its listeners on first use.
+    """
+    directory = getattr(bot, "converters_channel_directory", None)
+    if directory is None:
+        directory = bot.converters_channel_directory = ChannelDirectory(bot)
+        directory.install(bot)
+    return directory
+
+
+class EmojiIndex:
+    """
+    The custom emojis of every guild the bot is in, keyed by ID and by casefolded name.
+
+    Name lookups rank the given guild's emojis first, and exact-case matches before other spellings.
+    The index is built from ``bot.emojis`` on first use and kept up to date from emoji and guild events.
+    """
+
+    events = (
+        "on_guild_emojis_update",
+        "on_guild_join",
+        "on_guild_available",
+        "on_guild_remove",
+    )
+
+    def __init__(self):
+        self._ids: Dict[int, discord.Emoji] = {}
+        self._names: Dict[str, List[discord.Emoji]] = {}
+        self._guild_names: Dict[Tuple[int, str], List[discord.Emoji]] = {}
+
+    def __len__(self):
+        return len(self._ids)
+
+    def install(self, bot: Bot):
+        for event in self.events:
+            bot.add_listener(getattr(self, event), event)
+
+    def add(self, emoji: discord.Emoji):
+        if emoji.id in self._ids:
+            self.remove(emoji.id)
+        self._ids[emoji.id] = emoji
+        name = emoji.name.casefold()
+        self._names.setdefault(name, []).append(emoji)
+        self._guild_names.setdefault((emoji.guild_id, name), []).append(emoji)
+
+    def remove(self, emoji_id: int):
+        emoji = self._ids.pop(emoji_id, None)
+        if emoji is None:
+            return
+        name = emoji.name.casefold()
+        for store, key in ((self._names, name), (self._guild_names, (emoji.guild_id, name))):
+            emojis = store[key]
+            emojis.remove(emoji)
+            if not emojis:
+                del store[key]
+
+    def update(self, emojis: Iterable[discord.Emoji]):
+        for emoji in emojis:
+            self.add(emoji)
+
+    def get(self, emoji_id: int) -> discord.Emoji | None:
+        return self._ids.get(emoji_id)
+
+    def find(self, name: str, guild_id: int | None = None) -> List[discord.Emoji]:
+        """
+        Returns every emoji called ``name`` (ignoring case), the given guild's first and exact-case matches first within each.
+        """
+        folded = name.casefold()
+        local = self._guild_names.get((guild_id, folded), [])
+        others = [emoji for emoji in self._names.get(folded, ()) if emoji.guild_id != guild_id]
+        return sorted(local, key=lambda e: e.name != name) + sorted(others, key=lambda e: e.name != name)
+
+    def first(self, name: str, guild_id: int | None = None) -> discord.Emoji | None:
+        """
+        Returns the best match for ``name``, as ranked by :meth:`find`, without building the whole list.
+        """
+        folded = name.casefold()
+        for emojis in (self._guild_names.get((guild_id, folded)), self._names.get(folded)):
+            if emojis:
+                return next((emoji for emoji in emojis if emoji.name == name), emojis[0])
+        return None
+
+    def remove_guild(self, guild_id: int):
+        for emoji_id in [emoji_id for emoji_id, emoji in self._ids.items() if emoji.guild_id == guild_id]:
+            self.remove(emoji_id)
+
+    async def on_guild_emojis_update(self, guild: discord.Guild, before, after):
+        for emoji in before:
+            self.remove(emoji.id)
+        self.update(after)
+
+    async def on_guild_join(self, guild: discord.Guild):
+        self.update(guild.emojis)
+
+    async def on_guild_available(self, guild: discord.Guild):
+        self.update(guild.emojis)
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.remove_guild(guild.id)
+
+
+def get_emoji_index(bot: Bot) -> EmojiIndex:
+    """
+    Returns the bot's :class:`EmojiIndex`, creating it and registering its listeners on first use.
+    """
+    index = getattr(bot, "converters_emoji_index", None)
+    if index is None:
+        index = bot.converters_emoji_index = EmojiIndex()
+        index.update(bot.emojis)
+        index.install(bot)
+    return index
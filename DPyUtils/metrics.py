@@ -0,0 +1,313 @@
+import logging
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence
+
+
+@dataclass
+class Timing:
+    """
+    How many times a path was taken and how long it took.
+
+    Attributes
+    ----------
+    count: int
+        The amount of times the path was taken
+    total: float
+        The total seconds spent in the path
+    max: float
+        The longest single run of the path, in seconds
+    """
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, elapsed: float):
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+
+class Timings:
+    """
+    Accumulates a :class:`Timing` per named path.
+
+    Examples
+    --------
+    .. code-block:: python3
+
+        from DPyUtils.converters import member_lookup_timings
+
+        @bot.command()
+        async def lookups(ctx):
+            await ctx.send("\n".join(f"{path}: {t.count}x, {t.mean * 1000:.2f}ms avg" for path, t in member_lookup_timings.items()))
+    """
+
+    def __init__(self):
+        self._timings: Dict[str, Timing] = {}
+
+    def __getitem__(self, path: str) -> Timing:
+        return self._timings.setdefault(path, Timing())
+
+    def items(self):
+        return self._timings.items()
+
+    def record(self, path: str, elapsed: float):
+        """
+        Records one run of a path that took ``elapsed`` seconds.
+        """
+        self[path].add(elapsed)
+
+    @contextmanager
+    def time(self, path: str):
+        """
+        A context manager that records the time spent inside it under ``path``.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(path, time.perf_counter() - start)
+
+    def reset(self):
+        self._timings.clear()
+
+
+class Histogram:
+    """
+    Counts values into fixed buckets.
+
+    Parameters
+    ----------
+    bounds : Sequence[float]
+        The inclusive upper bound of each bucket, ascending. Values above the last one go in an overflow bucket.
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """
+        Returns the upper bound of the bucket the ``p``-th percentile (0-100) falls in.
+        """
+        rank = p / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank and count:
+                return bound
+        return 0.0
+
+    def to_dict(self) -> dict:
+        labels = [str(bound) for bound in self.bounds] + ["inf"]
+        return {"count": self.count, "mean": self.mean, "buckets": dict(zip(labels, self.counts))}
+
+
+# Seconds
+LATENCY_BOUNDS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+CANDIDATE_BOUNDS = (1, 2, 5, 10, 25, 100, 1000)
+# Names of the search tiers, best first, as reported in ConversionEvent.tier
+TIERS = ("exact", "prefix", "iprefix", "substring", "isubstring")
+
+
+@dataclass
+class ConversionEvent:
+    """
+    What happened during one converter call.
+
+    Attributes
+    ----------
+    converter : str
+        The converter's class name
+    elapsed : float
+        Seconds the call took, including any prompt
+    error : str | None
+        The exception's class name, if the conversion failed
+    path : str | None
+        ``"cache"`` (resolution cache hit), ``"id"`` (ID or mention), ``"name"``, ``"parse"`` (converters that
+        don't look anything up, like colors) or ``"bulk"`` (the list converters)
+    tier : str | None
+        The search tier that matched: one of :data:`TIERS`, ``"extra"``, ``"fuzzy"`` or ``"none"``
+    searched : int | None
+        How many objects the search looked through
+    candidates : int | None
+        How many objects the matching tier held
+    fallbacks : List[str]
+        The slow paths taken, like ``"fetch_user"`` (REST) or ``"query_members"`` (gateway)
+    prompted : bool
+        Whether the user was asked to pick between several results
+    """
+
+    converter: str
+    elapsed: float = 0.0
+    error: str | None = None
+    path: str | None = None
+    tier: str | None = None
+    searched: int | None = None
+    candidates: int | None = None
+    fallbacks: List[str] = field(default_factory=list)
+    prompted: bool = False
+
+
+@dataclass
+class ConverterStats:
+    """
+    The aggregated :class:`ConversionEvent`\\ s of one converter, kept by :class:`MemorySink`.
+    """
+
+    calls: int = 0
+    errors: int = 0
+    prompts: int = 0
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BOUNDS))
+    candidates: Histogram = field(default_factory=lambda: Histogram(CANDIDATE_BOUNDS))
+    paths: Counter = field(default_factory=Counter)
+    tiers: Counter = field(default_factory=Counter)
+    fallbacks: Counter = field(default_factory=Counter)
+
+    @property
+    def prompt_rate(self) -> float:
+        return self.prompts / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "prompt_rate": self.prompt_rate,
+            "latency": self.latency.to_dict(),
+            "candidates": self.candidates.to_dict(),
+            "paths": dict(self.paths),
+            "tiers": dict(self.tiers),
+            "fallbacks": dict(self.fallbacks),
+        }
+
+
+class MemorySink:
+    """
+    Aggregates conversion events per converter in memory.
+
+    Examples
+    --------
+    .. code-block:: python3
+
+        from DPyUtils import metrics
+
+        sink = metrics.MemorySink()
+        metrics.add_sink(sink)
+        ...
+        stats = sink.converters["Member"]
+        print(stats.latency.percentile(99), stats.tiers.most_common(), stats.prompt_rate)
+    """
+
+    def __init__(self):
+        self.converters: Dict[str, ConverterStats] = {}
+
+    def __call__(self, event: ConversionEvent):
+        stats = self.converters.get(event.converter)
+        if stats is None:
+            stats = self.converters[event.converter] = ConverterStats()
+        stats.calls += 1
+        stats.errors += event.error is not None
+        stats.prompts += event.prompted
+        stats.latency.add(event.elapsed)
+        if event.candidates is not None:
+            stats.candidates.add(event.candidates)
+        if event.path is not None:
+            stats.paths[event.path] += 1
+        if event.tier is not None:
+            stats.tiers[event.tier] += 1
+        stats.fallbacks.update(event.fallbacks)
+
+    def to_dict(self) -> dict:
+        return {name: stats.to_dict() for name, stats in self.converters.items()}
+
+    def reset(self):
+        self.converters.clear()
+
+
+class LoggingSink:
+    """
+    Logs one line per conversion event.
+    """
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.DEBUG):
+        self.logger = logger or logging.getLogger("DPyUtils.converters.metrics")
+        self.level = level
+
+    def __call__(self, event: ConversionEvent):
+        self.logger.log(self.level, "%s", event)
+
+
+class CallbackSink:
+    """
+    Passes every conversion event to a function, e.g. to feed an external metrics client.
+    """
+
+    def __init__(self, callback: Callable[[ConversionEvent], None]):
+        self.callback = callback
+
+    def __call__(self, event: ConversionEvent):
+        self.callback(event)
+
+
+# The sinks conversion events are sent to; instrumentation is skipped entirely while this is empty
+sinks: List[Callable[[ConversionEvent], None]] = []
+current_event: ContextVar[ConversionEvent | None] = ContextVar("current_event", default=None)
+
+
+def add_sink(sink: Callable[[ConversionEvent], None]):
+    """
+    Starts sending conversion events to ``sink``, any callable taking a :class:`ConversionEvent`.
+    """
+    if sink not in sinks:
+        sinks.append(sink)
+
+
+def remove_sink(sink: Callable[[ConversionEvent], None]):
+    if sink in sinks:
+        sinks.remove(sink)
+
+
+def emit(event: ConversionEvent):
+    for sink in tuple(sinks):
+        try:
+            sink(event)
+        except Exception:
+            logging.getLogger(__name__).exception("Metrics sink %r failed", sink)
+
+
+def note(**fields):
+    """
+    Sets fields on the event of the conversion in progress, if it's being instrumented.
+    """
+    if sinks and (event := current_event.get()) is not None:
+        for name, value in fields.items():
+            setattr(event, name, value)
+
+
+def note_fallback(name: str):
+    """
+    Records that the conversion in progress took a slow path, if it's being instrumented.
+    """
+    if sinks and (event := current_event.get()) is not None:
+        event.fallbacks.append(name)
@@ -0,0 +1,141 @@
+"""
+Vectorized helpers for whole arrays of discord snowflakes.
+
+These need NumPy, which is only imported the first time one of them is called
+(``pip install DPyUtils[numpy]``). Every function accepts an :class:`~DPyUtils.converters.IntSequence`
+(what :class:`~DPyUtils.converters.IntList` returns), a NumPy array or any iterable of ints.
+"""
+
+import datetime
+from collections import namedtuple
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Union
+
+from discord.utils import DISCORD_EPOCH, time_snowflake, utcnow
+
+from .converters import IntSequence
+from .utils import _numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DecodedSnowflakes = namedtuple("DecodedSnowflakes", "timestamp worker_id process_id increment")
+
+# Messages older than this can't be deleted with bulk delete
+BULK_DELETE_MAX_AGE = datetime.timedelta(days=14)
+
+Snowflakes = Union[IntSequence, "np.ndarray", Iterable[int]]
+
+
+def as_array(ids: Snowflakes) -> "np.ndarray":
+    """
+    Converts snowflakes to a 1-dimensional ``int64`` array without going through a list of Python ints.
+    Packed chunks of an :class:`IntSequence` are copied as-is and its ranges become :func:`numpy.arange` calls.
+    """
+    np = _numpy("DPyUtils.snowflakes")
+    if isinstance(ids, np.ndarray):
+        return ids.astype(np.int64, copy=False).ravel()
+    if isinstance(ids, IntSequence):
+        parts = [
+            np.arange(s.start, s.stop, s.step, dtype=np.int64) if isinstance(s, range) else np.frombuffer(s, np.int64)
+            for s in ids._segments
+        ]
+        return np.concatenate(parts) if parts else np.empty(0, np.int64)
+    return np.fromiter(ids, np.int64)
+
+
+def decode(ids: Snowflakes) -> DecodedSnowflakes:
+    """
+    Splits snowflakes into their parts.
+
+    Returns
+    -------
+    DecodedSnowflakes
+        A namedtuple of arrays: ``timestamp`` (``datetime64[ms]``, UTC), ``worker_id``, ``process_id`` and ``increment``
+    """
+    ids = as_array(ids)
+    return DecodedSnowflakes(
+        timestamp=((ids >> 22) + DISCORD_EPOCH).astype("datetime64[ms]"),
+        worker_id=(ids >> 17) & 0x1F,
+        process_id=(ids >> 12) & 0x1F,
+        increment=ids & 0xFFF,
+    )
+
+
+def timestamps(ids: Snowflakes) -> "np.ndarray":
+    """
+    Returns the creation time of each snowflake as a ``datetime64[ms]`` (UTC) array.
+    """
+    return ((as_array(ids) >> 22) + DISCORD_EPOCH).astype("datetime64[ms]")
+
+
+def sort(ids: Snowflakes, *, unique: bool = False) -> "np.ndarray":
+    """
+    Sorts snowflakes oldest first, optionally dropping repeats.
+    """
+    np = _numpy("DPyUtils.snowflakes")
+    ids = as_array(ids)
+    return np.unique(ids) if unique else np.sort(ids)
+
+
+def between(
+    ids: Snowflakes, after: Optional[datetime.datetime] = None, before: Optional[datetime.datetime] = None
+) -> "np.ndarray":
+    """
+    Returns the snowflakes created after ``after`` and before ``before`` (both exclusive), keeping their order.
+    The window is turned into two snowflakes once, so the IDs are compared without being decoded.
+    """
+    ids = as_array(ids)
+    mask = None
+    if after is not None:
+        mask = ids > time_snowflake(after, high=True)
+    if before is not None:
+        below = ids < time_snowflake(before, high=False)
+        mask = below if mask is None else mask & below
+    return ids if mask is None else ids[mask]
+
+
+def younger_than(ids: Snowflakes, age: datetime.timedelta, *, now: Optional[datetime.datetime] = None) -> "np.ndarray":
+    """
+    Returns the snowflakes created less than ``age`` ago.
+    """
+    return between(ids, after=(now or utcnow()) - age)
+
+
+def bulk_delete_eligible(ids: Snowflakes, *, now: Optional[datetime.datetime] = None) -> "np.ndarray":
+    """
+    Returns the message IDs that are still young enough to be deleted with bulk delete.
+
+    Examples
+    --------
+    .. code-block:: python3
+
+        @bot.command()
+        async def purge_ids(ctx, ids: IntList(unique=True)):
+            eligible = bulk_delete_eligible(ids)
+            await ctx.channel.delete_messages([discord.Object(i) for i in eligible.tolist()])
+    """
+    return younger_than(ids, BULK_DELETE_MAX_AGE, now=now)
+
+
+def bucket(ids: Snowflakes, interval: datetime.timedelta) -> Dict[datetime.datetime, "np.ndarray"]:
+    """
+    Groups snowflakes by creation time into buckets of ``interval``, aligned to the unix epoch.
+
+    Returns
+    -------
+    Dict[datetime.datetime, numpy.ndarray]
+        The start of each non-empty bucket (UTC, oldest first) to the IDs created in it, in their original order
+    """
+    np = _numpy("DPyUtils.snowflakes")
+    ids = as_array(ids)
+    width = int(interval / datetime.timedelta(milliseconds=1))
+    if width <= 0:
+        raise ValueError("interval must be positive")
+    keys = ((ids >> 22) + DISCORD_EPOCH) // width
+    order = np.argsort(keys, kind="stable")
+    starts, first = np.unique(keys[order], return_index=True)
+    groups = np.split(ids[order], first[1:])
+    return {
+        datetime.datetime.fromtimestamp(int(start) * width / 1000, datetime.timezone.utc): group
+        for start, group in zip(starts, groups)
+    }
@@ -0,0 +1,271 @@
+import asyncio
+import re
+import time
+from abc import ABCMeta, abstractmethod
+from typing import Any, Callable, Dict, List, Type
+
+import discord
+from discord import Interaction, app_commands
+from discord.ext.commands import BadArgument, ChannelNotFound, MemberNotFound, NoPrivateMessage, RoleNotFound
+
+from . import converters
+from .converters import _member_filter, check_bot, schedule_chunk, search
+from .indexes import NameIndex, get_channel_directory, get_member_index, get_role_index
+from .utils import trim
+
+_ID_REGEX = re.compile(r"(?:<(?:@[!&]?|#))?([0-9]{15,20})>?$")
+
+
+class IndexTransformer(app_commands.Transformer, metaclass=ABCMeta):
+    """
+    The base of the transformers that let the converters be used in app commands, as string options
+    with autocomplete.
+
+    Autocomplete answers from one of the incremental name indexes, ranked like :func:`converters.search`,
+    and returns whatever it found once ``budget`` seconds have passed. A newer keystroke from the same user
+    cancels their previous request if it's still waiting. Picking a suggestion sends the object's ID;
+    typed text is resolved by name, and ambiguous names are rejected instead of prompting.
+
+    Subclasses implement :meth:`index` and :meth:`get`.
+
+    Attributes
+    ----------
+    budget : float
+        The most seconds an autocomplete request may spend
+    limit : int
+        The maximum amount of suggestions, Discord allows at most 25
+    """
+
+    budget: float = 0.25
+    limit: int = 25
+    noun: str = "object"
+
+    def __init__(self):
+        self._pending: Dict[int, asyncio.Task] = {}
+
+    @property
+    def type(self) -> discord.AppCommandOptionType:
+        return discord.AppCommandOptionType.string
+
+    @abstractmethod
+    def index(self, interaction: Interaction) -> NameIndex:
+        """
+        Returns the name index of the interaction's guild to suggest and search from.
+        """
+
+    def keep(self) -> Callable[[Any], bool] | None:
+        """
+        Returns a predicate the suggested objects must pass, if any.
+        """
+        return None
+
+    def choice(self, obj) -> app_commands.Choice:
+        return app_commands.Choice(name=trim(obj.name, 100), value=str(obj.id))
+
+    async def more(self, interaction: Interaction, value: str, found: List[Any], deadline: float) -> List[Any]:
+        """
+        Called when the index couldn't fill the suggestions, to look further before ``deadline``.
+        """
+        return found
+
+    async def autocomplete(self, interaction: Interaction, value: str) -> List[app_commands.Choice]:
+        if interaction.guild is None:
+            return []
+        user_id = interaction.user.id
+        if (stale := self._pending.get(user_id)) is not None:
+            stale.cancel()
+        task = self._pending[user_id] = asyncio.current_task()
+        try:
+            index = self.index(interaction)
+            deadline = time.perf_counter() + self.budget
+            found = index.suggest(value, self.limit, self.keep(), deadline)
+            if len(found) < self.limit and time.perf_counter() < deadline:
+                found = await self.more(interaction, value, found, deadline)
+            return [self.choice(obj) for obj in found[: self.limit]]
+        finally:
+            if self._pending.get(user_id) is task:
+                del self._pending[user_id]
+
+    def search_kwargs(self) -> dict:
+        return {}
+
+    @abstractmethod
+    def get(self, interaction: Interaction, object_id: int):
+        """
+        Returns the object with the given ID from the interaction's guild, or None if there isn't a suitable one.
+        """
+
+    def not_found(self, value: str) -> BadArgument:
+        return BadArgument(f'{self.noun.capitalize()} "{value}" not found.')
+
+    async def check(self, value: str, result):
+        return result
+
+    async def transform(self, interaction: Interaction, value: str):
+        if interaction.guild is None:
+            raise NoPrivateMessage()
+        value = value.strip()
+        if match := _ID_REGEX.match(value):
+            result = self.get(interaction, int(match.group(1)))
+        else:
+            index = self.index(interaction)
+            result = search(value, index, **self.search_kwargs()) if len(index) else None
+            if result is not None and (keep := self.keep()) is not None:
+                result = [x for x in result if keep(x)] if isinstance(result, list) else [result]
+                result = result[0] if len(result) == 1 else result or None
+        if isinstance(result, list):
+            raise BadArgument(
+                f"There are multiple {self.noun}s matching `{value}`, please pick one from the suggestions."
+            )
+        if result is None:
+            raise self.not_found(value)
+        return await self.check(value, result)
+
+
+class MemberTransformer(IndexTransformer):
+    """
+    Autocompletes members by name and display name. In guilds that aren't chunked yet, suggestions the cache
+    can't fill are asked of the gateway (and the guild is chunked in the background, given the members intent).
+
+    Parameters
+    ----------
+    converter : Type[converters.Member]
+        The converter whose ``mem_type`` the members must match
+    """
+
+    noun = "member"
+
+    def __init__(self, converter: "Type[converters.Member]" = converters.Member):
+        super().__init__()
+        self.mem_type = converter.mem_type
+
+    def index(self, interaction: Interaction) -> NameIndex:
+        return get_member_index(interaction.client).get(interaction.guild)
+
+    def keep(self):
+        return _member_filter(None, self.mem_type)
+
+    def search_kwargs(self) -> dict:
+        return {"mem_type": self.mem_type}
+
+    def choice(self, member: discord.Member) -> app_commands.Choice:
+        name = member.name if member.display_name == member.name else f"{member.display_name} (@{member.name})"
+        return app_commands.Choice(name=trim(name, 100), value=str(member.id))
+
+    async def more(self, interaction: Interaction, value: str, found: List[Any], deadline: float) -> List[Any]:
+        guild = interaction.guild
+        index = self.index(interaction)
+        if index.complete or not value:
+            return found
+        schedule_chunk(guild)
+        try:
+            members = await asyncio.wait_for(
+                guild.query_members(value, limit=self.limit), max(deadline - time.perf_counter(), 0)
+            )
+        except asyncio.TimeoutError:
+            return found
+        keep = self.keep()
+        for member in members:
+            index.add(member)
+        seen = {obj.id for obj in found}
+        return found + [m for m in members if m.id not in seen and (keep is None or keep(m))]
+
+    def get(self, interaction: Interaction, object_id: int):
+        return interaction.guild.get_member(object_id)
+
+    def not_found(self, value: str) -> BadArgument:
+        return MemberNotFound(value)
+
+    async def check(self, value: str, result):
+        return await check_bot(value, result, "Member", mem_type=self.mem_type)
+
+    async def transform(self, interaction: Interaction, value: str):
+        try:
+            return await super().transform(interaction, value)
+        except MemberNotFound:
+            # Members of unchunked guilds may not be cached
+            match = _ID_REGEX.match(value.strip())
+            if match is None:
+                raise
+            try:
+                member = await interaction.guild.fetch_member(int(match.group(1)))
+            except discord.HTTPException:
+                raise MemberNotFound(value) from None
+            return await self.check(value, member)
+
+
+class RoleTransformer(IndexTransformer):
+    """
+    Autocompletes roles by name.
+    """
+
+    noun = "role"
+
+    def index(self, interaction: Interaction) -> NameIndex:
+        return get_role_index(interaction.client).get(interaction.guild)
+
+    def get(self, interaction: Interaction, object_id: int):
+        return interaction.guild.get_role(object_id)
+
+    def not_found(self, value: str) -> BadArgument:
+        return RoleNotFound(value)
+
+
+class ChannelTransformer(IndexTransformer):
+    """
+    Autocompletes channels or threads of the type a channel converter resolves.
+
+    Parameters
+    ----------
+    converter : Type[converters.TextChannel]
+        The channel converter, whose ``channel_attribute`` and ``channel_type`` are used
+    """
+
+    def __init__(self, converter: "Type[converters.TextChannel]"):
+        super().__init__()
+        self.attribute = converter.channel_attribute
+        self.channel_type = converter.channel_type
+        self.news = getattr(converter, "news", False)
+        self.noun = "thread" if self.attribute == "threads" else "channel"
+
+    def index(self, interaction: Interaction) -> NameIndex:
+        return get_channel_directory(interaction.client).index(interaction.guild, self.attribute)
+
+    def keep(self):
+        return (lambda channel: channel.is_news()) if self.news else None
+
+    def choice(self, channel) -> app_commands.Choice:
+        name = f"{channel.name} (in #{channel.parent.name})" if getattr(channel, "parent", None) else channel.name
+        return app_commands.Choice(name=trim(name, 100), value=str(channel.id))
+
+    def get(self, interaction: Interaction, object_id: int):
+        channel = interaction.guild.get_channel_or_thread(object_id)
+        if not isinstance(channel, self.channel_type) or (self.news and not channel.is_news()):
+            return None
+        return channel
+
+    def not_found(self, value: str) -> BadArgument:
+        return ChannelNotFound(value)
+
+
+TRANSFORMERS: Dict[type, IndexTransformer] = {
+    converters.Member: MemberTransformer(converters.Member),
+    converters.BotMember: MemberTransformer(converters.BotMember),
+    converters.HumanMember: MemberTransformer(converters.HumanMember),
+    converters.Role: RoleTransformer(),
+    **{
+        converter: ChannelTransformer(converter)
+        for converter in (
+            converters.TextChannel,
+            converters.NewsChannel,
+            converters.VoiceChannel,
+            converters.StageChannel,
+            converters.CategoryChannel,
+            converters.ForumChannel,
+            converters.Thread,
+        )
+    },
+}
+
+# Lets the converters be used as-is in app commands and hybrid commands
+app_commands.transformers.BUILT_IN_TRANSFORMERS.update(TRANSFORMERS)
@@ -0,0 +1,234 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+import discord
+from discord.ext.commands import Bot
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY, fetched_at REAL NOT NULL, data TEXT NOT NULL)"
+_FETCHED_AT_INDEX = "CREATE INDEX IF NOT EXISTS users_fetched_at ON users (fetched_at)"
+
+
+def _user_payload(user: discord.abc.User) -> Dict[str, Any]:
+    """
+    Rebuilds the API payload of a user from its attributes, in the shape :class:`discord.User` is created from.
+    """
+    payload = {
+        "id": str(user.id),
+        "username": user.name,
+        "discriminator": user.discriminator,
+        "global_name": user.global_name,
+        "avatar": user._avatar,
+        "banner": user._banner,
+        "accent_color": user._accent_colour,
+        "public_flags": user._public_flags,
+        "bot": user.bot,
+        "system": user.system,
+    }
+    for attr, key in (
+        ("_avatar_decoration_data", "avatar_decoration_data"),
+        ("_primary_guild", "primary_guild"),
+        ("_collectibles", "collectibles"),
+    ):
+        if (value := getattr(user, attr, None)) is not None:
+            payload[key] = value
+    return payload
+
+
+class UserCache:
+    """
+    Keeps the users fetched over REST in an SQLite file, so they don't have to be fetched again after a restart.
+
+    Every query runs on a dedicated worker thread, so the event loop never waits on disk. The database is only
+    opened on first use, so enabling the cache costs nothing at startup; expired rows are pruned in the
+    background right after that (and whenever :meth:`prune` is called), never as part of a lookup.
+    Stale entries are treated as missing, and a cached user is refreshed whenever ``on_user_update`` fires for them.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The SQLite file, created if it doesn't exist
+    ttl : float
+        How many seconds a fetched user stays valid, a week by default
+
+    Attributes
+    ----------
+    hits : int
+        The amount of lookups answered from disk
+    misses : int
+        The amount of lookups that weren't stored or were stale
+    """
+
+    events = ("on_user_update",)
+
+    def __init__(self, path: "str | os.PathLike", ttl: float = 7 * 24 * 60 * 60):
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._db: sqlite3.Connection | None = None
+        # One thread owns the connection, which also serializes every query
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="DPyUtils-usercache")
+        self._prune_scheduled = False
+
+    def install(self, bot: Bot):
+        for event in self.events:
+            bot.add_listener(getattr(self, event), event)
+
+    def uninstall(self, bot: Bot):
+        for event in self.events:
+            bot.remove_listener(getattr(self, event), event)
+
+    def _connection(self) -> sqlite3.Connection:
+        # Only called on the worker thread
+        if self._db is None:
+            db = sqlite3.connect(self.path, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(_SCHEMA)
+            db.execute(_FETCHED_AT_INDEX)
+            self._db = db
+        return self._db
+
+    def _execute(self, query: str, parameters: tuple = ()) -> list:
+        return self._connection().execute(query, parameters).fetchall()
+
+    def _prune(self):
+        self._execute("DELETE FROM users WHERE fetched_at < ?", (time.time() - self.ttl,))
+
+    async def _run(self, query: str, parameters: tuple = ()) -> list:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, self._execute, query, parameters)
+        if not self._prune_scheduled:
+            # Queued behind this query, so the first lookup doesn't wait for it
+            self._prune_scheduled = True
+            loop.run_in_executor(self._executor, self._prune)
+        return await future
+
+    async def prune(self):
+        """
+        Deletes the entries that are older than the TTL.
+        """
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._prune)
+
+    async def get(self, bot: Bot, user_id: int) -> discord.User | None:
+        """
+        Returns the stored user with the given ID, or None if they aren't stored or are stale.
+        """
+        rows = await self._run("SELECT fetched_at, data FROM users WHERE id = ?", (user_id,))
+        if not rows or rows[0][0] < time.time() - self.ttl:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return bot._connection.create_user(json.loads(rows[0][1]))
+
+    async def set(self, user: discord.abc.User):
+        """
+        Stores a user, replacing any older entry.
+        """
+        await self._run(
+            "INSERT OR REPLACE INTO users (id, fetched_at, data) VALUES (?, ?, ?)",
+            (user.id, time.time(), json.dumps(_user_payload(user), separators=(",", ":"))),
+        )
+
+    async def delete(self, user_id: int):
+        await self._run("DELETE FROM users WHERE id = ?", (user_id,))
+
+    async def clear(self):
+        await self._run("DELETE FROM users")
+
+    def close(self):
+        """
+        Closes the database once the queries already queued have run.
+        """
+
+        def close_db():
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+        self._executor.submit(close_db)
+        self._executor.shutdown(wait=False)
+
+    def disk_size(self) -> int:
+        """
+        Returns the bytes the database takes on disk, including its write-ahead log.
+        """
+        return sum(os.path.getsize(p) for p in (self.path, self.path + "-wal") if os.path.exists(p))
+
+    async def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": (await self._run("SELECT COUNT(*) FROM users"))[0][0],
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "disk_bytes": self.disk_size(),
+        }
+
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        if self._db is not None and await self._run("SELECT 1 FROM users WHERE id = ?", (after.id,)):
+            await self.set(after)
+
+
+def enable_user_cache(bot: Bot, path: "str | os.PathLike", *, ttl: float = 7 * 24 * 60 * 60) -> UserCache:
+    """
+    Makes the converters' ``fetch_user`` fallbacks check a persistent :class:`UserCache` before REST, and store what
+    they fetch in it. The cache is available afterwards as ``bot.converters_user_cache``.
+
+    Parameters
+    ----------
+    bot : Bot
+        Your bot instance
+    path : str | os.PathLike
+        The SQLite file to keep users in
+    ttl : float
+        How many seconds a fetched user stays valid
+
+    Examples
+    --------
+    .. code-block:: python3
+
+        cache = enable_user_cache(bot, "users.sqlite3", ttl=24 * 60 * 60)
+        ...
+        print(await cache.stats())  # {'size': 5120, 'hits': 3817, 'misses': 1304, 'hit_rate': 0.75, 'disk_bytes': 1630208}
+    """
+    disable_user_cache(bot)
+    cache = bot.converters_user_cache = UserCache(path, ttl)
+    cache.install(bot)
+    return cache
+
+
+def disable_user_cache(bot: Bot):
+    """
+    Stops using the persistent user cache and closes its database.
+    """
+    cache = getattr(bot, "converters_user_cache", None)
+    if cache is not None:
+        cache.uninstall(bot)
+        cache.close()
+        del bot.converters_user_cache
+
+
+async def fetch_user(bot: Bot, user_id: int) -> discord.User:
+    """
+    Fetches a user over REST, answering from the bot's :class:`UserCache` first if one is enabled.
+
+    Raises
+    ------
+    discord.NotFound
+        The user doesn't exist
+    discord.HTTPException
+        Fetching the user failed
+    """
+    cache: UserCache | None = getattr(bot, "converters_user_cache", None)
+    if cache is not None and (user := await cache.get(bot, user_id)) is not None:
+        return user
+    user = await bot.fetch_user(user_id)
+    if cache is not None:
+        await cache.set(user)
+    return user
@@ -131,3 +131,14 @@ def yn(val: bool):
     Convert a value to Yes/No
     """
     return "Yes" if val else "No"
+
+
+def _numpy(feature: str):
+    """
+    Imports NumPy for an optional feature, explaining how to install it if it's missing.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(f"{feature} needs NumPy, install it with `pip install numpy`.") from e
+    return numpy
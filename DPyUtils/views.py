@@ -1,8 +1,9 @@
 from typing import Union
 
-from discord import ButtonStyle, Interaction, Member, User, ui
+from discord import ButtonStyle, CategoryChannel, Interaction, Member, SelectOption, User, abc, ui
 
 from . import Context
+from .utils import trim
 
 
 class Confirmation(ui.View):
@@ -57,3 +58,104 @@ class Confirmation(ui.View):
         await interaction.send(self.cancel_message, ephemeral=self.ephemeral)
         self.resp = False
         self.stop()
+
+
+class Disambiguation(ui.View):
+    """
+    A select menu that lets the command invoker pick one of several search results.
+    Results are split into pages of 25 options, with buttons to move between pages.
+
+    Component interactions are routed by custom_id through discord.py's view store, so there's
+    no per-message check running while the menu is open.
+
+    Parameters
+    ----------
+    ctx : Union[Context, Interaction]
+        The context or interaction to get the user from
+    results : list
+        The results to choose from
+    timeout : float = 20
+        How many seconds to wait for a choice
+
+    Attributes
+    ----------
+    choice
+        The chosen result, or None if nothing was chosen
+    cancelled : bool
+        Whether the user pressed cancel
+    """
+
+    per_page = 25
+
+    def __init__(self, ctx: Union[Context, Interaction], results: list, *, timeout: float = 20, **kwargs):
+        self.user: Union[Member, User] = ctx.user if isinstance(ctx, Interaction) else ctx.author
+        self.results: list = results
+        self.page: int = 0
+        self.pages: int = -(-len(results) // self.per_page)
+        self.choice = None
+        self.cancelled: bool = False
+
+        super().__init__(timeout=timeout, **kwargs)
+        self._render()
+
+    @staticmethod
+    def _option(index: int, result) -> SelectOption:
+        label = str(result) if isinstance(result, (Member, User)) else getattr(result, "name", str(result))
+        if isinstance(result, abc.GuildChannel) and not isinstance(result, CategoryChannel):
+            label = f"#{label}"
+        description = f"ID: {result.id}"
+        if category := getattr(result, "category", None):
+            description += f" | in {category}"
+        return SelectOption(
+            label=trim(f"{index + 1}. {label}", 100), value=str(index), description=trim(description, 100)
+        )
+
+    def _render(self):
+        start = self.page * self.per_page
+        self.pick.options = [
+            self._option(i, result)
+            for i, result in enumerate(self.results[start : start + self.per_page], start)  # noqa: E203
+        ]
+        self.pick.placeholder = f"Pick one ({self.page + 1}/{self.pages})" if self.pages > 1 else "Pick one"
+        self.previous.disabled = self.page == 0
+        self.next.disabled = self.page >= self.pages - 1
+        if self.pages < 2:
+            self.remove_item(self.previous)
+            self.remove_item(self.next)
+
+    async def run(self):
+        """
+        Waits for the user to choose, returning the chosen result, or None on timeout or cancel.
+        """
+        await self.wait()
+        return self.choice
+
+    async def interaction_check(self, interaction: Interaction) -> bool:
+        return interaction.user.id == self.user.id
+
+    @ui.select(placeholder="Pick one")
+    async def pick(self, interaction: Interaction, select: ui.Select) -> None:
+        index = int(select.values[0])
+        self.choice = self.results[index]
+        await interaction.response.edit_message(
+            content=f"Picked **{self._option(index, self.choice).label}**.", view=None
+        )
+        self.stop()
+
+    @ui.button(label="Previous", style=ButtonStyle(2))
+    async def previous(self, interaction: Interaction, button: ui.Button) -> None:
+        self.page -= 1
+        self._render()
+        await interaction.response.edit_message(view=self)
+
+    @ui.button(label="Next", style=ButtonStyle(2))
+    async def next(self, interaction: Interaction, button: ui.Button) -> None:
+        self.page += 1
+        self._render()
+        await interaction.response.edit_message(view=self)
+
+    @ui.button(emoji="❌", label="Cancel", style=ButtonStyle(4))
+    async def cancel(self, interaction: Interaction, button: ui.Button) -> None:
+        self.cancelled = True
+        await interaction.response.edit_message(content="Canceled command.", view=None)
+        self.stop()
@@ -0,0 +1,275 @@
+"""
+Times the converters against synthetic guild state built from real discord.py objects, without a gateway.
+
+Every case runs one converter tier (ID, mention, exact, prefix, case-insensitive prefix, substring,
+ambiguous and miss) and reports ops/sec and tracemalloc allocations as JSON, so runs can be diffed
+and gated. Ambiguous results are resolved to their first match instead of prompting, so those cases
+time the lookup rather than the UI.
+
+Usage: python benchmarks/bench_converters.py [--sizes 10000 100000 1000000] [--roles 2000] [--channels 2000]
+                                             [--seconds 0.5] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import datetime
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import discord  # noqa: E402
+from discord.ext import commands  # noqa: E402
+
+from DPyUtils import converters  # noqa: E402
+
+# Syllables from several scripts, so names exercise casefolding and non-ASCII comparisons
+SYLLABLES = (
+    "ka ri no su me ta lo vi an el or is um ex "
+    "Zé Ré ßa Çu Ño Øy Åk "
+    "Да ни ла Ωμ έγ ας "
+    "さく らの はな 김민 서연 "
+    "★ ✿ ツ"
+).split()
+JOINED_AT = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc).isoformat()
+
+
+def make_name(rng: random.Random) -> str:
+    name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5)))
+    return name.capitalize() if rng.random() < 0.3 else name
+
+
+def build_state(members: int, roles: int, channels: int, seed: int = 0):
+    rng = random.Random(seed)
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.all())
+    state = bot._connection
+    guild_id = 10**17
+    next_id = iter(range(guild_id + 1, guild_id + 10**9))
+    role_data = [
+        {"id": guild_id, "name": "@everyone", "permissions": "0", "position": 0, "color": 0, "hoist": False}
+    ] + [
+        {"id": next(next_id), "name": make_name(rng), "permissions": "0", "position": i + 1, "color": 0, "hoist": False}
+        for i in range(roles)
+    ]
+    channel_data = []
+    categories = [next(next_id) for _ in range(max(channels // 50, 1))]
+    for i, category_id in enumerate(categories):
+        channel_data.append({"id": category_id, "type": 4, "name": make_name(rng), "position": i})
+    for i in range(channels):
+        kind = rng.choice((0, 0, 0, 2, 5, 13, 15))
+        channel_data.append(
+            {
+                "id": next(next_id),
+                "type": kind,
+                "name": make_name(rng).lower().replace(" ", "-"),
+                "position": i,
+                "parent_id": rng.choice(categories),
+                "bitrate": 64000,
+                "user_limit": 0,
+            }
+        )
+    member_data = []
+    for _ in range(members):
+        username = make_name(rng).lower()
+        member_data.append(
+            {
+                "user": {
+                    "id": next(next_id),
+                    "username": username,
+                    "discriminator": "0",
+                    "global_name": make_name(rng) if rng.random() < 0.5 else None,
+                    "avatar": None,
+                    "bot": rng.random() < 0.02,
+                },
+                "nick": make_name(rng) if rng.random() < 0.2 else None,
+                "roles": [],
+                "joined_at": JOINED_AT,
+                "deaf": False,
+                "mute": False,
+                "flags": 0,
+            }
+        )
+    guild = discord.Guild(
+        data={
+            "id": guild_id,
+            "name": "Benchmark",
+            "channels": channel_data,
+            "roles": role_data,
+            "members": member_data,
+            "member_count": members,
+            "emojis": [],
+            "stickers": [],
+        },
+        state=state,
+    )
+    state._add_guild(guild)
+    return bot, guild
+
+
+def make_context(bot, guild):
+    channel = guild.text_channels[0]
+    return SimpleNamespace(
+        bot=bot,
+        guild=guild,
+        channel=channel,
+        author=guild.members[0],
+        message=SimpleNamespace(mentions=[], guild=guild, channel=channel),
+    )
+
+
+def pick_cases(objects, attribute, id_format, rng):
+    """
+    Picks an argument for every tier from the objects' names.
+    """
+    names = [getattr(obj, attribute) for obj in objects]
+    counts = {}
+    for name in names:
+        counts[name] = counts.get(name, 0) + 1
+    target = next(obj for obj in rng.sample(objects, len(objects)) if counts[getattr(obj, attribute)] == 1)
+    name = getattr(target, attribute)
+    prefixes = {}
+    for n in names:
+        prefixes[n[:3]] = prefixes.get(n[:3], 0) + 1
+    ambiguous = max(prefixes, key=prefixes.get)
+    return {
+        "id": str(target.id),
+        "mention": id_format.format(target.id),
+        "exact": name,
+        "prefix": name[: max(len(name) - 1, 1)],
+        "iprefix": name[: max(len(name) - 1, 1)].swapcase(),
+        "substring": name[1:],
+        "ambiguous": ambiguous,
+        "miss": "☃nobody-by-this-name",
+    }
+
+
+async def first_result(ctx, result, argument):
+    return result[0]
+
+
+def run_case(loop, fn, seconds):
+    # Warm up, then run for about ``seconds``
+    loop.run_until_complete(fn())
+    runs = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        loop.run_until_complete(fn())
+        runs += 1
+        if time.perf_counter() >= deadline:
+            break
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        loop.run_until_complete(fn())
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "ops_per_sec": runs / elapsed,
+        "mean_us": elapsed / runs * 1e6,
+        "runs": runs,
+        "alloc_peak_bytes": peak - before,
+        "alloc_retained_bytes": after - before,
+    }
+
+
+def converter_call(converter, ctx, argument):
+    async def call():
+        try:
+            return await converter.convert(ctx, argument)
+        except commands.BadArgument:
+            return None
+
+    return call
+
+
+def search_call(argument, objects, *attrs):
+    async def call():
+        return converters.search(argument, objects, *attrs)
+
+    return call
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--roles", type=int, default=2000)
+    parser.add_argument("--channels", type=int, default=2000)
+    parser.add_argument("--seconds", type=float, default=0.5, help="how long to run each case")
+    parser.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    converters.result_handler = first_result
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    rng = random.Random(1)
+    report = {
+        "python": platform.python_version(),
+        "discord.py": discord.__version__,
+        "seconds_per_case": args.seconds,
+        "results": [],
+    }
+    for size in args.sizes:
+        start = time.perf_counter()
+        bot, guild = build_state(size, args.roles, args.channels)
+        setup = {"build_state_s": time.perf_counter() - start}
+        ctx = make_context(bot, guild)
+        start = time.perf_counter()
+        converters.get_member_index(bot).get(guild)
+        converters.get_user_index(bot)
+        setup["build_indexes_s"] = time.perf_counter() - start
+        print(f"{size} members: state built in {setup['build_state_s']:.1f}s", file=sys.stderr)
+
+        members = list(guild.members)
+        text_channels = list(guild.text_channels)
+        suites = {
+            "search": (lambda a: search_call(a, members, "name", "display_name"), members, "display_name", "<@{}>"),
+            "Member.convert": (lambda a: converter_call(converters.Member, ctx, a), members, "display_name", "<@{}>"),
+            "User.convert": (lambda a: converter_call(converters.User, ctx, a), members, "name", "<@{}>"),
+            "Role.convert": (lambda a: converter_call(converters.Role, ctx, a), guild.roles[1:], "name", "<@&{}>"),
+            "TextChannel.convert": (
+                lambda a: converter_call(converters.TextChannel, ctx, a),
+                text_channels,
+                "name",
+                "<#{}>",
+            ),
+            "AnyChannel.convert": (
+                lambda a: converter_call(converters.AnyChannel(), ctx, a),
+                list(guild.channels),
+                "name",
+                "<#{}>",
+            ),
+        }
+        for suite, (make_call, objects, attribute, id_format) in suites.items():
+            for tier, argument in pick_cases(objects, attribute, id_format, rng).items():
+                if suite == "search" and tier in ("id", "mention"):
+                    continue
+                result = run_case(loop, make_call(argument), args.seconds)
+                result.update(suite=suite, tier=tier, members=size, argument=argument)
+                report["results"].append(result)
+                print(f"  {suite:<20} {tier:<10} {result['ops_per_sec']:>12.1f} ops/s", file=sys.stderr)
+        report.setdefault("setup", {})[str(size)] = setup
+        del bot, guild, ctx, members, suites
+        gc.collect()
+    loop.close()
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(output, encoding="utf-8")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
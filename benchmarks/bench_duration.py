@@ -0,0 +1,97 @@
+"""
+Compares duration.to_seconds against the unanchored ``re.findall`` parser Duration.convert used before,
+on typical arguments and on pathological ones (long, garbage, or unit-less strings).
+
+Usage: python benchmarks/bench_duration.py [--seconds 1.0]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from DPyUtils.duration import InvalidTimeFormat, durations, to_seconds  # noqa: E402
+
+CASES = {
+    "typical": {
+        "integer": "3600",
+        "single": "10m",
+        "pair": "1h30m",
+        "full": "1y2w3d4h5m6s",
+        "decimal": "1.5h",
+        "spaced": "2 days, 4hr 30 min",
+    },
+    "pathological": {
+        "many_units": "1s" * 2000,
+        "long_digits": "9" * 3000 + "s",
+        "no_unit": "9" * 3000,
+        "garbage": "lorem ipsum " * 500,
+        "trailing_garbage": "1h30m" + "x" * 5000,
+    },
+}
+
+
+def legacy(argument: str) -> int:
+    try:
+        return int(argument)
+    except ValueError:
+        pass
+    seconds = 0
+    match = re.findall(r"([0-9]+?(?:\.[0-9]+)?[ywdhms])", argument)
+    if not match:
+        raise InvalidTimeFormat(argument)
+    for item in match:
+        seconds += float(item[:-1]) * durations[item[-1]]
+    return round(seconds)
+
+
+def time_calls(fns, argument: str, seconds: float, repeats: int = 7) -> list:
+    """
+    Returns the best mean microseconds per call of each ``fn(argument)``, counting a rejected argument
+    (or the old parser overflowing) as a call. The functions take turns, so noise hits them alike.
+    """
+    best = [float("inf")] * len(fns)
+    for _ in range(repeats):
+        for i, fn in enumerate(fns):
+            runs = 0
+            start = time.perf_counter()
+            deadline = start + seconds / repeats / len(fns)
+            while True:
+                try:
+                    fn(argument)
+                except (InvalidTimeFormat, OverflowError):
+                    pass
+                runs += 1
+                if time.perf_counter() >= deadline:
+                    break
+            best[i] = min(best[i], (time.perf_counter() - start) / runs * 1e6)
+    return best
+
+
+def outcome(fn, argument: str) -> str:
+    try:
+        return str(fn(argument))
+    except InvalidTimeFormat:
+        return "invalid"
+    except OverflowError:
+        return "overflow"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=1.0, help="how long to run each case")
+    args = parser.parse_args(argv)
+
+    print(f"{'case':<28}{'findall us':>12}{'scanner us':>12}{'speedup':>9}  results")
+    for group, cases in CASES.items():
+        for name, argument in cases.items():
+            old, new = time_calls((legacy, to_seconds), argument, args.seconds)
+            results = f"{outcome(legacy, argument)[:12]} -> {outcome(to_seconds, argument)[:12]}"
+            print(f"{group + '/' + name:<28}{old:>12.2f}{new:>12.2f}{old / new:>8.1f}x  {results}")
+
+
+if __name__ == "__main__":
+    main()
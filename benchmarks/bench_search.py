@@ -0,0 +1,83 @@
+"""
+Compares converters.search against the five-pass cascade it replaced, on synthetic objects.
+
+Usage: python benchmarks/bench_search.py [sizes...]
+"""
+
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from DPyUtils.converters import search  # noqa: E402
+
+
+class Obj:
+    __slots__ = ("id", "name", "display_name")
+
+    def __init__(self, id, name, display_name):
+        self.id = id
+        self.name = name
+        self.display_name = display_name
+
+
+def legacy_search(argument, iterable, *attrs):
+    iterable = tuple(iterable)
+    result = None
+    checks = [
+        lambda x: any([getattr(x, attr, None) == argument for attr in attrs]),
+        lambda x: any([getattr(x, attr, None).startswith(argument) for attr in attrs]),
+        lambda x: any([getattr(x, attr, None).lower().startswith(argument.lower()) for attr in attrs]),
+        lambda x: any([argument in getattr(x, attr, None) for attr in attrs]),
+        lambda x: any([argument.lower() in getattr(x, attr, None).lower() for attr in attrs]),
+    ]
+    for check in checks:
+        if result:
+            break
+        result = [x for x in iterable if check(x)]
+    return result
+
+
+def make_objects(n, seed=0):
+    rng = random.Random(seed)
+    letters = string.ascii_letters + "éßΣ"
+
+    def word():
+        return "".join(rng.choice(letters) for _ in range(rng.randint(4, 14)))
+
+    return [Obj(i, word(), word()) for i in range(n)]
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes):
+    print(f"{'size':>9} {'case':<10} {'legacy ms':>10} {'search ms':>10} {'speedup':>8}")
+    for size in sizes:
+        objs = make_objects(size)
+        target = objs[size // 2]
+        cases = {
+            "exact": target.name,
+            "prefix": target.name[:4],
+            "iprefix": target.name[:4].swapcase(),
+            "substring": target.name[1:5],
+            "miss": "\x00nothing",
+        }
+        repeat = 5 if size <= 100_000 else 1
+        for case, arg in cases.items():
+            old = timed(lambda: legacy_search(arg, objs, "name", "display_name"), repeat)
+            new = timed(lambda: search(arg, objs, "name", "display_name"), repeat)
+            print(f"{size:>9} {case:<10} {old * 1000:>10.2f} {new * 1000:>10.2f} {old / new:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
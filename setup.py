@@ -34,4 +34,5 @@ setup(
     description="Some discord.py utils by Clari",
     long_description=long_description,
     packages=["DPyUtils"],
+    extras_require={"numpy": ["numpy"]},
 )